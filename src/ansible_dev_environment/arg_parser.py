@@ -22,16 +22,23 @@ try:
     from ._version import version as __version__  # type: ignore[unused-ignore,import-not-found]
 except ImportError:  # pragma: no cover
     try:
-        import pkg_resources
+        from importlib.metadata import version
 
-        __version__ = pkg_resources.get_distribution(
-            "ansible_dev_environment",
-        ).version
+        __version__ = version("ansible_dev_environment")
     except Exception:  # pylint: disable=broad-except # noqa: BLE001
         # this is the fallback SemVer version picked by setuptools_scm when tag
         # information is not available.
         __version__ = "0.1.dev1"
 
+SUBCOMMANDS = {
+    "check": "Check installed collections",
+    "inspect": "Inspect installed collections",
+    "list": "List installed collections",
+    "tree": "Generate a dependency tree",
+    "install": "Install a collection.",
+    "uninstall": "Uninstall a collection.",
+}
+
 
 def common_args(parser: ArgumentParser) -> None:
     """Add common arguments to the parser.
@@ -71,6 +78,54 @@ def common_args(parser: ArgumentParser) -> None:
     )
 
 
+def _install_args(parser: ArgumentParser) -> None:
+    """Add the install subcommand arguments to the parser.
+
+    Args:
+        parser: The install subcommand parser
+    """
+    parser.add_argument(
+        "-e",
+        "--editable",
+        action="store_true",
+        help="Install editable.",
+    )
+
+    parser.add_argument(
+        # "-adt",
+        "--seed",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        dest="seed",
+        help="Install seed packages inside the virtual environment (ansible-dev-tools).",
+    )
+
+
+def _level2(level1: ArgumentParser) -> ArgumentParser:
+    """Build the parent parser for subcommands that target collections.
+
+    Args:
+        level1: The parent parser shared by all subcommands
+
+    Returns:
+        The parent parser
+    """
+    level2 = ArgumentParser(add_help=False, parents=[level1])
+    level2.add_argument(
+        "collection_specifier",
+        help="Collection name or path to collection with extras.",
+        nargs="*",
+    )
+    level2.add_argument(
+        "-r",
+        "--requirement <file>",
+        dest="requirement",
+        help="Install from the given requirements file.",
+        required=False,
+    )
+    return level2
+
+
 def parse() -> argparse.Namespace:
     """Parse the command line arguments.
 
@@ -139,81 +194,6 @@ def parse() -> argparse.Namespace:
 
     common_args(level1)
 
-    _check = subparsers.add_parser(
-        "check",
-        formatter_class=CustomHelpFormatter,
-        parents=[level1],
-        help="Check installed collections",
-    )
-
-    _inspect = subparsers.add_parser(
-        "inspect",
-        formatter_class=CustomHelpFormatter,
-        parents=[level1],
-        help="Inspect installed collections",
-    )
-
-    _list = subparsers.add_parser(
-        "list",
-        formatter_class=CustomHelpFormatter,
-        parents=[level1],
-        help="List installed collections",
-    )
-
-    _tree = subparsers.add_parser(
-        "tree",
-        formatter_class=CustomHelpFormatter,
-        parents=[level1],
-        help="Generate a dependency tree",
-    )
-
-    level2 = ArgumentParser(add_help=False, parents=[level1])
-    level2.add_argument(
-        "collection_specifier",
-        help="Collection name or path to collection with extras.",
-        nargs="*",
-    )
-    level2.add_argument(
-        "-r",
-        "--requirement <file>",
-        dest="requirement",
-        help="Install from the given requirements file.",
-        required=False,
-    )
-
-    install = subparsers.add_parser(
-        "install",
-        formatter_class=CustomHelpFormatter,
-        parents=[level2],
-        help="Install a collection.",
-    )
-    install.add_argument(
-        "-e",
-        "--editable",
-        action="store_true",
-        help="Install editable.",
-    )
-
-    install.add_argument(
-        # "-adt",
-        "--seed",
-        action=argparse.BooleanOptionalAction,
-        default=True,
-        dest="seed",
-        help="Install seed packages inside the virtual environment (ansible-dev-tools).",
-    )
-
-    _uninstall = subparsers.add_parser(
-        "uninstall",
-        formatter_class=CustomHelpFormatter,
-        parents=[level2],
-        help="Uninstall a collection.",
-    )
-
-    _group_titles(parser)
-    for subparser in subparsers.choices.values():
-        _group_titles(subparser)
-
     args = sys.argv[1:]
     for i, v in enumerate(args):
         for old in ("-adt", "--ansible-dev-tools"):
@@ -221,24 +201,48 @@ def parse() -> argparse.Namespace:
                 msg = f"Replace the deprecated {old} argument with --seed to avoid future execution failure."
                 logger.warning(msg)
                 args[i] = "--seed"
-    return parser.parse_args(args)
-
 
-def _group_titles(parser: ArgumentParser) -> None:
-    """Set the group titles to be capitalized.
+    # Only the invoked subcommand needs a parser, all are built for help and errors
+    names = args[:1] if args and args[0] in SUBCOMMANDS else list(SUBCOMMANDS)
+    for name in names:
+        parents = [_level2(level1)] if name in ("install", "uninstall") else [level1]
+        subparser = subparsers.add_parser(
+            name,
+            formatter_class=CustomHelpFormatter,
+            parents=parents,
+            help=SUBCOMMANDS[name],
+        )
+        if name == "install":
+            _install_args(subparser)
 
-    Args:
-        parser: The parser to set the group titles for
-    """
-    for group in parser._action_groups:  # noqa: SLF001
-        if group.title is None:
-            continue
-        group.title = group.title.capitalize()
+    return parser.parse_args(args)
 
 
 class ArgumentParser(argparse.ArgumentParser):
     """A custom argument parser."""
 
+    def add_argument_group(
+        self,
+        *args: Any,  # noqa: ANN401
+        **kwargs: Any,  # noqa: ANN401
+    ) -> argparse._ArgumentGroup:
+        """Add an argument group with a capitalized title.
+
+        argparse creates the default groups and copies those of parent parsers
+        through here, so every group title is set once as the group is made.
+
+        Args:
+            *args: The arguments
+            **kwargs: The keyword arguments
+
+        Returns:
+            The argument group
+        """
+        group = super().add_argument_group(*args, **kwargs)
+        if group.title is not None:
+            group.title = group.title.capitalize()
+        return group
+
     def add_argument(  # type: ignore[override]
         self,
         *args: Any,  # noqa: ANN401
@@ -275,6 +279,8 @@ class CustomHelpFormatter(HelpFormatter):
             indent_increment=1,
             max_help_position=len(long_string) + 3,
         )
+        # argparse formats each action invocation repeatedly while laying out help
+        self._invocations: dict[int, str] = {}
 
     def _format_action_invocation(
         self,
@@ -291,17 +297,21 @@ class CustomHelpFormatter(HelpFormatter):
         Returns:
             The formatted action invocation
         """
-        if not action.option_strings:
-            default = self._get_default_metavar_for_positional(action)
-            (metavar,) = self._metavar_formatter(action, default)(1)
-            return metavar
-
-        if len(action.option_strings) == 1:
-            return action.option_strings[0]
+        invocation = self._invocations.get(id(action))
+        if invocation is not None:
+            return invocation
 
         max_variations = 2
-        if len(action.option_strings) == max_variations:
+        if not action.option_strings:
+            default = self._get_default_metavar_for_positional(action)
+            (invocation,) = self._metavar_formatter(action, default)(1)
+        elif len(action.option_strings) == 1:
+            invocation = action.option_strings[0]
+        elif len(action.option_strings) == max_variations:
             # Account for a --1234 --long-option-name
-            return f"{action.option_strings[0].ljust(6)} {action.option_strings[1]}"
-        msg = "Too many option strings"
-        raise ValueError(msg)
+            invocation = f"{action.option_strings[0].ljust(6)} {action.option_strings[1]}"
+        else:
+            msg = "Too many option strings"
+            raise ValueError(msg)
+        self._invocations[id(action)] = invocation
+        return invocation
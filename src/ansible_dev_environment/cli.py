@@ -20,6 +20,12 @@ from .utils import TermFeatures
 if TYPE_CHECKING:
     from argparse import Namespace
 
+# Environment variables that point ansible at collections outside the venv
+ISOLATION_ENV_VARS = ("ANSIBLE_COLLECTIONS_PATHS", "ANSIBLE_COLLECTION_PATH")
+# The user directory is joined to the home directory when checked, HOME may change
+HOME_COLLECTIONS = ".ansible/collections/ansible_collections"
+USR_COLLECTIONS = Path("/usr/share/ansible/collections")
+
 
 class Cli:
     """The Cli class."""
@@ -63,62 +69,47 @@ class Cli:
         if "~" in os.environ.get("PATH", ""):
             err = "~ character was found inside PATH, correct your environment configuration to avoid it. See https://stackoverflow.com/a/44704799/99834"
             self.output.critical(err)
+        # Not every subcommand defines these, look each up once
+        requirement = getattr(self.args, "requirement", None)
+        editable = getattr(self.args, "editable", False)
+        collection_specifier = getattr(self.args, "collection_specifier", None) or ()
+
         # Missing args
-        if (
-            hasattr(self.args, "requirement")
-            and self.args.requirement
-            and not self.args.requirement.exists()
-        ):
-            err = f"Requirements file not found: {self.args.requirement}"
+        if requirement and not requirement.exists():
+            err = f"Requirements file not found: {requirement}"
             self.output.critical(err)
 
         # Multiple editable collections
-        if (
-            hasattr(self.args, "collection_specifier")
-            and len(self.args.collection_specifier) > 1
-            and hasattr(self.args, "editable")
-            and self.args.editable
-        ):
+        if len(collection_specifier) > 1 and editable:
             err = "Editable can only be used with a single collection specifier."
             self.output.critical(err)
 
         # Editable with requirements file
-        if (
-            hasattr(self.args, "requirement")
-            and self.args.requirement
-            and hasattr(self.args, "editable")
-            and self.args.editable
-        ):
+        if requirement and editable:
             err = "Editable can not be used with a requirements file."
             self.output.critical(err)
 
     def ensure_isolated(self) -> None:
         """Ensure the environment is isolated."""
-        env_vars = os.environ
         errored = False
-        if "ANSIBLE_COLLECTIONS_PATHS" in env_vars:
-            err = "ANSIBLE_COLLECTIONS_PATHS is set"
-            self.output.error(err)
-            hint = "Run `unset ANSIBLE_COLLECTIONS_PATHS` to unset it."
-            self.output.hint(hint)
-            errored = True
-        if "ANSIBLE_COLLECTION_PATH" in env_vars:
-            err = "ANSIBLE_COLLECTION_PATH is set"
-            self.output.error(err)
-            hint = "Run `unset ANSIBLE_COLLECTION_PATH` to unset it."
-            self.output.hint(hint)
-            errored = True
-
-        home_coll = Path.home() / ".ansible/collections/ansible_collections"
-        if home_coll.exists() and tuple(home_coll.iterdir()):
+        for env_var in ISOLATION_ENV_VARS:
+            if env_var in os.environ:
+                err = f"{env_var} is set"
+                self.output.error(err)
+                hint = f"Run `unset {env_var}` to unset it."
+                self.output.hint(hint)
+                errored = True
+
+        home_coll = Path.home() / HOME_COLLECTIONS
+        if _has_entries(home_coll):
             err = f"Collections found in {home_coll}"
             self.output.error(err)
             hint = "Run `rm -rf ~/.ansible/collections` to remove them."
             self.output.hint(hint)
             errored = True
 
-        usr_coll = Path("/usr/share/ansible/collections")
-        if usr_coll.exists() and tuple(usr_coll.iterdir()):
+        usr_coll = USR_COLLECTIONS
+        if _has_entries(usr_coll):
             err = f"Collections found in {usr_coll}"
             self.output.error(err)
             hint = "Run `sudo rm -rf /usr/share/ansible/collections` to remove them."
@@ -146,13 +137,30 @@ class Cli:
 
     def _exit(self) -> None:
         """Exit the application setting the return code."""
-        if self.output.call_count["error"]:
+        call_count = self.output.call_count
+        if call_count["error"]:
             sys.exit(1)
-        if self.output.call_count["warning"]:
+        if call_count["warning"]:
             sys.exit(2)
         sys.exit(0)
 
 
+def _has_entries(path: Path) -> bool:
+    """Determine if a directory has any entries without listing all of them.
+
+    Args:
+        path: The directory
+
+    Returns:
+        True if the directory exists and is not empty
+    """
+    try:
+        with os.scandir(path) as entries:
+            return next(entries, None) is not None
+    except OSError:
+        return False
+
+
 def main(*, dry: bool = False) -> None:
     """Entry point for ansible-creator CLI.
 
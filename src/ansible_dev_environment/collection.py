@@ -2,20 +2,39 @@
 
 from __future__ import annotations
 
+import os
 import re
 
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import yaml
 
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+
 if TYPE_CHECKING:
     from .config import Config
     from .output import Output
 
 
+RE_NON_LOCAL_COLLECTION = re.compile(
+    r"""
+    (?P<cnamespace>[A-Za-z0-9]+)    # collection name
+    \.                              # dot
+    (?P<cname>[A-Za-z0-9]+)         # collection name
+    (?P<specifier>[^A-Za-z0-9].*)?   # optional specifier
+    """,
+    re.VERBOSE,
+)
+
+
 @dataclass
 class Collection:  # pylint: disable=too-many-instance-attributes
     """A collection request specification.
@@ -47,20 +66,18 @@ class Collection:  # pylint: disable=too-many-instance-attributes
         """Return the collection name."""
         return f"{self.cnamespace}.{self.cname}"
 
-    @property
+    @cached_property
     def cache_dir(self) -> Path:
-        """Return the collection cache directory."""
+        """Return the collection cache directory, created on first access."""
         collection_cache_dir = self.config.venv_cache_dir / self.name
-        if not collection_cache_dir.exists():
-            collection_cache_dir.mkdir()
+        collection_cache_dir.mkdir(exist_ok=True)
         return collection_cache_dir
 
-    @property
+    @cached_property
     def build_dir(self) -> Path:
-        """Return the collection cache directory."""
+        """Return the collection build directory, created on first access."""
         collection_build_dir = self.cache_dir / "build"
-        if not collection_build_dir.exists():
-            collection_build_dir.mkdir()
+        collection_build_dir.mkdir(exist_ok=True)
         return collection_build_dir
 
     @property
@@ -90,26 +107,32 @@ def parse_collection_request(  # noqa: PLR0915
     Returns:
         A collection object
     """
-    # spec with dep, local
-    if "[" in string and "]" in string:
-        msg = f"Found optional dependencies in collection request: {string}"
-        output.debug(msg)
-        path = Path(string.split("[")[0]).expanduser().resolve()
-        if not path.exists():
+    # The debug messages are only formatted when they will be shown or logged
+    debug = output.debug_enabled
+    # spec with dep, local, a closing bracket is only looked for after the opening one
+    left = string.find("[")
+    right = string.find("]", left + 1) if left != -1 else -1
+    if right != -1:
+        if debug:
+            msg = f"Found optional dependencies in collection request: {string}"
+            output.debug(msg)
+        path = Path(string[:left]).expanduser().resolve()
+        if not os.access(path, os.F_OK):
             msg = "Provide an existing path to a collection when specifying optional dependencies."
             output.hint(msg)
             msg = f"Failed to find collection path: {path}"
             output.critical(msg)
-        msg = f"Found local collection request with dependencies: {string}"
-        output.debug(msg)
-        msg = f"Setting collection path: {path}"
-        output.debug(msg)
-        opt_deps = string.split("[")[1].split("]")[0]
-        msg = f"Setting optional dependencies: {opt_deps}"
-        output.debug(msg)
+        opt_deps = string[left + 1 : right]
+        if debug:
+            msg = f"Found local collection request with dependencies: {string}"
+            output.debug(msg)
+            msg = f"Setting collection path: {path}"
+            output.debug(msg)
+            msg = f"Setting optional dependencies: {opt_deps}"
+            output.debug(msg)
+            msg = "Setting request as local"
+            output.debug(msg)
         local = True
-        msg = "Setting request as local"
-        output.debug(msg)
         collection = Collection(
             config=config,
             path=path,
@@ -123,15 +146,18 @@ def parse_collection_request(  # noqa: PLR0915
         )
         get_galaxy(collection=collection, output=output)
         return collection
-    # spec without dep, local
-    path = Path(string).expanduser().resolve()
-    if path.exists():
-        msg = f"Found local collection request without dependencies: {string}"
-        output.debug(msg)
-        msg = f"Setting collection path: {path}"
-        output.debug(msg)
-        msg = "Setting request as local"
-        output.debug(msg)
+    # spec without dep, local, resolved only once it is known to exist as
+    # collection names are far more common and need a single access call to rule out
+    path = Path(string).expanduser()
+    if os.access(path, os.F_OK):
+        path = path.resolve()
+        if debug:
+            msg = f"Found local collection request without dependencies: {string}"
+            output.debug(msg)
+            msg = f"Setting collection path: {path}"
+            output.debug(msg)
+            msg = "Setting request as local"
+            output.debug(msg)
         local = True
         collection = Collection(
             config=config,
@@ -146,45 +172,31 @@ def parse_collection_request(  # noqa: PLR0915
         )
         get_galaxy(collection=collection, output=output)
         return collection
-    non_local_re = re.compile(
-        r"""
-        (?P<cnamespace>[A-Za-z0-9]+)    # collection name
-        \.                              # dot
-        (?P<cname>[A-Za-z0-9]+)         # collection name
-        (?P<specifier>[^A-Za-z0-9].*)?   # optional specifier
-        """,
-        re.VERBOSE,
-    )
-    matched = non_local_re.match(string)
+    matched = RE_NON_LOCAL_COLLECTION.match(string)
     if not matched:
         msg = "Specify a valid collection name (ns.n) with an optional version specifier"
         output.hint(msg)
         msg = f"Failed to parse collection request: {string}"
         output.critical(msg)
         raise SystemExit(1)  # pragma: no cover # (critical is a sys.exit)
-    msg = f"Found non-local collection request: {string}"
-    output.debug(msg)
-
     cnamespace = matched.group("cnamespace")
-    msg = f"Setting collection namespace: {cnamespace}"
-    output.debug(msg)
-
     cname = matched.group("cname")
-    msg = f"Setting collection name: {cname}"
-    output.debug(msg)
-
-    if matched.group("specifier"):
-        specifier = matched.group("specifier")
-        msg = f"Setting collection specifier: {specifier}"
+    specifier = matched.group("specifier") or ""
+    local = False
+    if debug:
+        msg = f"Found non-local collection request: {string}"
         output.debug(msg)
-    else:
-        specifier = ""
-        msg = "Setting collection specifier as empty"
+        msg = f"Setting collection namespace: {cnamespace}"
+        output.debug(msg)
+        msg = f"Setting collection name: {cname}"
+        output.debug(msg)
+        if specifier:
+            msg = f"Setting collection specifier: {specifier}"
+        else:
+            msg = "Setting collection specifier as empty"
+        output.debug(msg)
+        msg = "Setting request as non-local"
         output.debug(msg)
-
-    local = False
-    msg = "Setting request as non-local"
-    output.debug(msg)
 
     return Collection(
         config=config,
@@ -209,25 +221,26 @@ def get_galaxy(collection: Collection, output: Output) -> None:
         SystemExit: If the collection name is not found
     """
     file_name = collection.path / "galaxy.yml"
-    if not file_name.exists():
+    if not os.access(file_name, os.F_OK):
         err = f"Failed to find {file_name} in {collection.path}"
         output.critical(err)
 
-    with file_name.open(encoding="utf-8") as fileh:
-        try:
-            yaml_file = yaml.safe_load(fileh)
-        except yaml.YAMLError as exc:
-            err = f"Failed to load yaml file: {exc}"
-            output.critical(err)
+    # libyaml reads the whole buffer at once rather than pulling decoded chunks
+    try:
+        yaml_file = yaml.load(file_name.read_bytes(), Loader=SafeLoader)
+    except yaml.YAMLError as exc:
+        err = f"Failed to load yaml file: {exc}"
+        output.critical(err)
 
     try:
         collection.cnamespace = yaml_file["namespace"]
         collection.cname = yaml_file["name"]
-        msg = f"Found collection name: {collection.name} from {file_name}."
-        output.debug(msg)
     except KeyError as exc:
         err = f"Failed to find collection name in {file_name}: {exc}"
         output.critical(err)
     else:
+        if output.debug_enabled:
+            msg = f"Found collection name: {collection.name} from {file_name}."
+            output.debug(msg)
         return
     raise SystemExit(1)  # pragma: no cover # (critical is a sys.exit)
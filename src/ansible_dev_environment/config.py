@@ -5,12 +5,15 @@ from __future__ import annotations
 import json
 import logging
 import os
+import shlex
 import shutil
 import subprocess
 import sys
+import sysconfig
 
+from functools import cached_property
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from .utils import subprocess_run
 
@@ -24,6 +27,8 @@ if TYPE_CHECKING:
 
 _logger = logging.getLogger(__name__)
 
+SITE_PKG_CACHE = "site_packages.json"
+
 
 def use_uv() -> bool:
     """Return whether to use uv commands like venv or pip.
@@ -49,10 +54,12 @@ class Config:  # pylint: disable=too-many-instance-attributes
 
     Attributes:
         pip_cmd: The pip command.
+        uv: Whether uv is used in place of pip and venv.
         venv_cmd: The venv command.
     """
 
     pip_cmd: str
+    uv: bool = False
     venv_cmd: str
 
     def __init__(
@@ -83,19 +90,20 @@ class Config:  # pylint: disable=too-many-instance-attributes
             self._create_venv = True
 
         self._set_interpreter()
-        self._set_site_pkg_path()
+        if not self._load_site_pkg_path():
+            self._set_site_pkg_path()
+            self._save_site_pkg_path()
 
-    @property
+    @cached_property
     def cache_dir(self) -> Path:
         """Return the cache directory."""
         cache_dir = self.venv / ".ansible-dev-environment"
-        if not cache_dir.exists():
-            cache_dir.mkdir(parents=True)
+        cache_dir.mkdir(parents=True, exist_ok=True)
         return cache_dir
 
-    @property
+    @cached_property
     def venv(self) -> Path:
-        """Return the virtual environment path.
+        """Return the virtual environment path, resolved once.
 
         Raises:
             SystemExit: If the virtual environment cannot be found.
@@ -128,11 +136,10 @@ class Config:  # pylint: disable=too-many-instance-attributes
     def site_pkg_collections_path(self) -> Path:
         """Return the site packages collection path."""
         site_pkg_collections_path = self.site_pkg_path / "ansible_collections"
-        if not site_pkg_collections_path.exists():
-            site_pkg_collections_path.mkdir()
+        site_pkg_collections_path.mkdir(exist_ok=True)
         return site_pkg_collections_path
 
-    @property
+    @cached_property
     def venv_bindir(self) -> Path:
         """Return the virtual environment bin directory."""
         return self.venv / "bin"
@@ -176,19 +183,20 @@ class Config:  # pylint: disable=too-many-instance-attributes
         """Set the interpreter."""
         self.pip_cmd = f"{sys.executable} -m pip"
         self.venv_cmd = f"{sys.executable} -m venv"
-        if use_uv():
+        self.uv = use_uv()
+        if self.uv:
             self.pip_cmd = f"{sys.executable} -m uv pip"
             # seed and python-preference make uv venv match python -m venv behavior:
             self.venv_cmd = f"{sys.executable} -m uv venv --seed --python-preference=system"
 
-        if not self.venv.exists():
+        if not os.access(self.venv, os.F_OK):
             if self._create_venv:
                 msg = f"Creating virtual environment: {self.venv}"
                 self._output.debug(msg)
-                command = f"{self.venv_cmd} {self.venv}"
+                command = [*shlex.split(self.venv_cmd), str(self.venv)]
                 msg = f"Creating virtual environment: {self.venv}"
                 if self.args.system_site_packages:
-                    command = f"{command} --system-site-packages"
+                    command.append("--system-site-packages")
                     msg = f"Creating virtual environment with system site packages: {self.venv}"
                 try:
                     subprocess_run(
@@ -208,7 +216,7 @@ class Config:  # pylint: disable=too-many-instance-attributes
         msg = f"Virtual environment: {self.venv}"
         self._output.debug(msg)
         venv_interpreter = self.venv / "bin" / "python"
-        if not venv_interpreter.exists():
+        if not os.access(venv_interpreter, os.F_OK):
             err = f"Cannot find interpreter: {venv_interpreter}."
             self._output.critical(err)
 
@@ -218,10 +226,83 @@ class Config:  # pylint: disable=too-many-instance-attributes
 
     def _set_site_pkg_path(self) -> None:
         """Use the interpreter to find the site packages path."""
-        command = (
-            f"{self.venv_interpreter} -c"
-            "'import json,sysconfig; print(json.dumps(sysconfig.get_paths()))'"
-        )
+        sysconfig_paths: dict[str, Any]
+        if Path(sys.prefix).resolve() == self.venv:
+            # Running from the target environment, its paths are known in-process
+            sysconfig_paths = dict(sysconfig.get_paths())
+        else:
+            sysconfig_paths = self._venv_sysconfig_paths()
+
+        if not sysconfig_paths:
+            err = "Failed to find site packages path."
+            self._output.critical(err)
+
+        purelib = sysconfig_paths.get("purelib", "")
+        if not purelib:
+            err = "Failed to find purelib in sysconfig paths."
+            self._output.critical(err)
+
+        self.site_pkg_path = Path(purelib)
+        msg = f"Found site packages path: {self.site_pkg_path}"
+        self._output.debug(msg)
+
+    def _site_pkg_cache_key(self) -> list[int]:
+        """Build the site packages cache key from the venv interpreter.
+
+        The venv interpreter links to the base interpreter, so the key changes
+        when that interpreter is replaced or upgraded.
+
+        Returns:
+            The base interpreter mtime and inode
+        """
+        stat = self.venv_interpreter.stat()
+        return [stat.st_mtime_ns, stat.st_ino]
+
+    def _load_site_pkg_path(self) -> bool:
+        """Load the site packages path cached for the venv interpreter.
+
+        Returns:
+            True if a valid cached path was found and set
+        """
+        try:
+            key = self._site_pkg_cache_key()
+            cached = json.loads((self.venv_cache_dir / SITE_PKG_CACHE).read_bytes())
+        except (OSError, ValueError):
+            return False
+        if not isinstance(cached, dict) or cached.get("key") != key:
+            return False
+        purelib = cached.get("purelib")
+        if not isinstance(purelib, str) or not purelib or not Path(purelib).is_dir():
+            return False
+
+        self.site_pkg_path = Path(purelib)
+        msg = f"Found cached site packages path: {self.site_pkg_path}"
+        self._output.debug(msg)
+        return True
+
+    def _save_site_pkg_path(self) -> None:
+        """Cache the site packages path for the venv interpreter."""
+        cache_file = self.venv_cache_dir / SITE_PKG_CACHE
+        pending = cache_file.with_suffix(".tmp")
+        try:
+            content = {"key": self._site_pkg_cache_key(), "purelib": str(self.site_pkg_path)}
+            pending.write_text(json.dumps(content), encoding="utf-8")
+            pending.replace(cache_file)
+        except OSError as exc:
+            msg = f"Failed to write site packages cache: {exc}"
+            self._output.debug(msg)
+
+    def _venv_sysconfig_paths(self) -> dict[str, Any]:
+        """Ask the virtual environment interpreter for its sysconfig paths.
+
+        Returns:
+            The sysconfig paths
+        """
+        command = [
+            str(self.venv_interpreter),
+            "-c",
+            "import json,sysconfig; print(json.dumps(sysconfig.get_paths()))",
+        ]
         work = "Locating site packages directory"
         try:
             proc = subprocess_run(
@@ -235,20 +316,8 @@ class Config:  # pylint: disable=too-many-instance-attributes
             self._output.critical(err)
 
         try:
-            sysconfig_paths = json.loads(proc.stdout)
+            sysconfig_paths: dict[str, Any] = json.loads(proc.stdout)
         except json.JSONDecodeError as exc:
             err = f"Failed to decode json: {exc}"
             self._output.critical(err)
-
-        if not sysconfig_paths:
-            err = "Failed to find site packages path."
-            self._output.critical(err)
-
-        purelib = sysconfig_paths.get("purelib")
-        if not purelib:
-            err = "Failed to find purelib in sysconfig paths."
-            self._output.critical(err)
-
-        self.site_pkg_path = Path(purelib)
-        msg = f"Found site packages path: {self.site_pkg_path}"
-        self._output.debug(msg)
+        return sysconfig_paths
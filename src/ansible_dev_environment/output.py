@@ -258,6 +258,17 @@ class Output:
         else:
             self.log_to_file = False
 
+    @property
+    def debug_enabled(self) -> bool:
+        """Return whether debug messages are printed or logged.
+
+        Callers in loops can check this before formatting a debug message.
+        """
+        debug = 2
+        if self._verbosity >= debug:
+            return True
+        return self.log_to_file and self.logger.isEnabledFor(logging.DEBUG)
+
     def critical(self, msg: str) -> None:
         """Print a critical message to the console.
 
@@ -332,8 +343,6 @@ class Output:
         if self.log_to_file:
             self.logger.log(level.log_level, msg, stacklevel=3)
 
-        set_width = console_width()
-
         debug = 2
         info = 1
         if (self._verbosity < debug and level == Level.DEBUG) or (
@@ -341,6 +350,8 @@ class Output:
         ):
             return
 
+        set_width = console_width()
+
         lines = Msg(message=msg, prefix=level).to_lines(
             color=self.term_features.color,
             width=set_width,
@@ -3,9 +3,45 @@
 # ruff: noqa: F401
 from __future__ import annotations
 
-from .checker import Checker as Check
-from .inspector import Inspector as Inspect
-from .installer import Installer as Install
-from .lister import Lister as List
-from .treemaker import TreeMaker as Tree
-from .uninstaller import UnInstaller as Uninstall
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from .checker import Checker as Check
+    from .inspector import Inspector as Inspect
+    from .installer import Installer as Install
+    from .lister import Lister as List
+    from .treemaker import TreeMaker as Tree
+    from .uninstaller import UnInstaller as Uninstall
+
+# Only the invoked subcommand's module is imported, on first access
+_SUBCOMMANDS = {
+    "Check": ("checker", "Checker"),
+    "Inspect": ("inspector", "Inspector"),
+    "Install": ("installer", "Installer"),
+    "List": ("lister", "Lister"),
+    "Tree": ("treemaker", "TreeMaker"),
+    "Uninstall": ("uninstaller", "UnInstaller"),
+}
+
+
+def __getattr__(name: str) -> type:
+    """Import a subcommand class when it is first accessed.
+
+    Args:
+        name: The subcommand class name
+
+    Returns:
+        The subcommand class
+
+    Raises:
+        AttributeError: If the name is not a subcommand
+    """
+    try:
+        module_name, class_name = _SUBCOMMANDS[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+    subcommand: type = getattr(import_module(f".{module_name}", __name__), class_name)
+    return subcommand
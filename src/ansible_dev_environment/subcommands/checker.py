@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import subprocess
 
+from functools import cache
 from typing import TYPE_CHECKING
 
 from packaging.specifiers import InvalidSpecifier, SpecifierSet
@@ -23,6 +24,32 @@ if TYPE_CHECKING:
     from ansible_dev_environment.output import Output
 
 
+@cache
+def _specifier(version: str) -> SpecifierSet:
+    """Parse a version specifier, collections often share the same ones.
+
+    Args:
+        version: The version specifier.
+
+    Returns:
+        The specifier set.
+    """
+    return SpecifierSet(version)
+
+
+@cache
+def _version(version: str) -> Version:
+    """Parse a version, a collection is usually required by several others.
+
+    Args:
+        version: The version.
+
+    Returns:
+        The version.
+    """
+    return Version(version)
+
+
 class Checker:
     """The dependency checker."""
 
@@ -52,26 +79,37 @@ class Checker:
             venv_cache_dir=self._config.venv_cache_dir,
         )
         missing = False
+        debug = self._output.debug_enabled
+
+        # The installed version of every collection, None if its metadata is malformed
+        installed_versions: dict[str, str | None] = {}
+        for collection_name, details in collections.items():
+            info = details.get("collection_info") if isinstance(details, dict) else None
+            version = info.get("version") if isinstance(info, dict) else None
+            installed_versions[collection_name] = version if isinstance(version, str) else None
+
         for collection_name, details in collections.items():
             error = "Collection {collection_name} has malformed metadata."
             if not isinstance(details, dict):
                 self._output.error(error)
                 continue
-            if not isinstance(details["collection_info"], dict):
+            info = details["collection_info"]
+            if not isinstance(info, dict):
                 self._output.error(error)
                 continue
-            if not isinstance(details["collection_info"]["dependencies"], dict):
+            deps = info["dependencies"]
+            if not isinstance(deps, dict):
                 self._output.error(error)
                 continue
 
-            msg = f"Checking dependencies for {collection_name}."
-            self._output.debug(msg)
-
-            deps = details["collection_info"]["dependencies"]
+            if debug:
+                msg = f"Checking dependencies for {collection_name}."
+                self._output.debug(msg)
 
             if not deps:
-                msg = f"Collection {collection_name} has no dependencies."
-                self._output.debug(msg)
+                if debug:
+                    msg = f"Collection {collection_name} has no dependencies."
+                    self._output.debug(msg)
                 continue
             for dep, version in deps.items():
                 if not isinstance(version, str):
@@ -82,26 +120,18 @@ class Checker:
                     self._output.error(err)
                     continue
                 try:
-                    spec = SpecifierSet(version)
+                    spec = _specifier(version)
                 except InvalidSpecifier:
-                    spec = SpecifierSet(">=0.0.0")
+                    spec = _specifier(">=0.0.0")
                     msg = f"Invalid version specifier {version}, assuming >=0.0.0."
                     self._output.debug(msg)
-                if dep in collections:
-                    dependency = collections[dep]
-                    error = "Collection {dep} has malformed metadata."
-                    if not isinstance(dependency, dict):
-                        self._output.error(error)
-                        continue
-                    if not isinstance(dependency["collection_info"], dict):
-                        self._output.error(error)
-                        continue
-
-                    dep_version = dependency["collection_info"]["version"]
-                    if not isinstance(dep_version, str):
+                if dep in installed_versions:
+                    dep_version = installed_versions[dep]
+                    if dep_version is None:
+                        error = "Collection {dep} has malformed metadata."
                         self._output.error(error)
                         continue
-                    dep_spec = Version(dep_version)
+                    dep_spec = _version(dep_version)
                     if not spec.contains(dep_spec):
                         err = (
                             f"Collection {collection_name} requires {dep} {version}"
@@ -110,7 +140,7 @@ class Checker:
                         self._output.error(err)
                         missing = True
 
-                    else:
+                    elif debug:
                         msg = (
                             f"Collection {collection_name} requires {dep} {version}"
                             f" and {dep} {dep_version} is installed."
@@ -139,11 +169,17 @@ class Checker:
             msg = "Install system packages and re-run `ade check`."
             self._output.hint(msg)
         missing_file = self._config.venv_cache_dir / "pip-report.txt"
-        command = (
-            f"{self._config.venv_interpreter} -m pip install -r"
-            f" {self._config.discovered_python_reqs} --dry-run"
-            f" --report {missing_file}"
-        )
+        command = [
+            str(self._config.venv_interpreter),
+            "-m",
+            "pip",
+            "install",
+            "-r",
+            str(self._config.discovered_python_reqs),
+            "--dry-run",
+            "--report",
+            str(missing_file),
+        ]
         work = "Building python package dependency tree"
 
         try:
@@ -184,7 +220,7 @@ class Checker:
         msg = "Checking system packages."
         self._output.info(msg)
 
-        command = f"bindep -b -f {self._config.discovered_bindep_reqs}"
+        command = ["bindep", "-b", "-f", str(self._config.discovered_bindep_reqs)]
         work = "Checking system package requirements"
         try:
             subprocess_run(
@@ -193,6 +229,12 @@ class Checker:
                 msg=work,
                 output=self._output,
             )
+        except FileNotFoundError as exc:
+            # Without a shell a missing executable is raised rather than reported
+            msg = f"Bindep failed to run. {exc}"
+            self._output.error(msg)
+            self._system_dep_missing = True
+            return
         except subprocess.CalledProcessError as exc:
             if exc.stderr:
                 msg = f"Bindep failed to find required system packages. {exc.stderr}"
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
 import re
+import shlex
 import shutil
+import stat
 import subprocess
 
 from pathlib import Path
@@ -48,7 +52,7 @@ class Installer:
         self._output = output
         self._current_collection_spec: str
 
-    def run(self) -> None:
+    def run(self) -> None:  # noqa: C901
         """Run the installer."""
         if self._config.args.collection_specifier and any(
             "," in s for s in self._config.args.collection_specifier
@@ -56,9 +60,12 @@ class Installer:
             err = "Multiple optional dependencies are not supported at this time."
             self._output.critical(err)
 
+        # ansible-galaxy is needed up front only when collections will be installed,
+        # otherwise ansible-core is resolved together with the python requirements
+        galaxy_needed = self._galaxy_needed()
         if self._config.args.seed:
             self._install_dev_tools()
-        else:
+        elif galaxy_needed:
             self._install_core()
 
         if self._config.args.requirement or self._config.args.cpi:
@@ -85,7 +92,7 @@ class Installer:
                 self._install_galaxy_collections(collections=distant_collections)
 
         builder_introspect(config=self._config, output=self._output)
-        self._pip_install()
+        self._pip_install(with_core=not self._config.args.seed and not galaxy_needed)
         Checker(config=self._config, output=self._output).system_deps()
 
         if self._config.args.venv and (self._config.interpreter != self._config.venv_interpreter):
@@ -97,6 +104,18 @@ class Installer:
             )
             self._output.note(msg)
 
+    def _galaxy_needed(self) -> bool:
+        """Determine if any collections will be installed using ansible-galaxy.
+
+        Returns:
+            True if ansible-galaxy will be run
+        """
+        return bool(
+            self._config.args.requirement
+            or self._config.args.cpi
+            or self._config.args.collection_specifier,
+        )
+
     def _install_core(self) -> None:
         """Install ansible-core if not installed already."""
         msg = "Installing ansible-core."
@@ -107,7 +126,7 @@ class Installer:
             return
         msg = "Installing ansible-core."
         self._output.debug(msg)
-        command = f"{self._config.venv_interpreter} -m pip install ansible-core"
+        command = [*self._pip_install_cmd(), "ansible-core"]
         try:
             subprocess_run(
                 command=command,
@@ -129,7 +148,7 @@ class Installer:
             return
         msg = "Installing ansible-dev-tools."
         self._output.debug(msg)
-        command = f"{self._config.venv_interpreter} -m pip install ansible-dev-tools"
+        command = [*self._pip_install_cmd(), "ansible-dev-tools"]
         try:
             subprocess_run(
                 command=command,
@@ -160,38 +179,36 @@ class Installer:
         self._output.info(msg)
 
         for collection in collections:
-            if collection.site_pkg_path.exists():
-                msg = f"Removing installed {collection.site_pkg_path}"
-                self._output.debug(msg)
-                if collection.site_pkg_path.is_symlink():
-                    collection.site_pkg_path.unlink()
-                else:
-                    shutil.rmtree(collection.site_pkg_path)
-
-        command = (
-            f"{self._config.galaxy_bin} collection"
-            f" install {collections_str}"
-            f" -p {self._config.site_pkg_path}"
-            " --force"
-        )
+            self._unlink_editable(collection.site_pkg_path)
+
+        command = [
+            str(self._config.galaxy_bin),
+            "collection",
+            "install",
+            *(collection.original for collection in collections),
+            "-p",
+            str(self._config.site_pkg_path),
+            "--force",
+        ]
         env = {
             "ANSIBLE_GALAXY_COLLECTIONS_PATH_WARNING": str(self._config.args.verbose),
         }
         msg = "Running ansible-galaxy to install non-local collection and it's dependencies."
         self._output.debug(msg)
+        installed: list[str] = []
         try:
-            proc = subprocess_run(
+            subprocess_run(
                 command=command,
                 env=env,
                 verbose=self._config.args.verbose,
                 msg=msg,
                 output=self._output,
+                line_handler=lambda line: installed.extend(self.RE_GALAXY_INSTALLED.findall(line)),
             )
         except subprocess.CalledProcessError as exc:
             err = f"Failed to install collection: {exc}\n{exc.stderr}"
             self._output.critical(err)
             raise SystemError(err) from exc  # pragma: no cover # critical exits
-        installed = self.RE_GALAXY_INSTALLED.findall(proc.stdout)
         msg = f"Installed collections include: {oxford_join(installed)}"
         self._output.note(msg)
 
@@ -208,33 +225,32 @@ class Installer:
             cnamespace = collection["name"].split(".")[0]
             cname = collection["name"].split(".")[1]
             cpath = self._config.site_pkg_collections_path / cnamespace / cname
-            if cpath.exists():
-                msg = f"Removing installed {cpath}"
-                self._output.debug(msg)
-                if cpath.is_symlink():
-                    cpath.unlink()
-                else:
-                    shutil.rmtree(cpath)
-
-        command = (
-            f"{self._config.galaxy_bin} collection"
-            f" install -r {self._config.args.requirement}"
-            f" -p {self._config.site_pkg_path}"
-            " --force"
-        )
+            self._unlink_editable(cpath)
+
+        command = [
+            str(self._config.galaxy_bin),
+            "collection",
+            "install",
+            "-r",
+            str(self._config.args.requirement),
+            "-p",
+            str(self._config.site_pkg_path),
+            "--force",
+        ]
         work = "Install collections from requirements file"
+        installed: list[str] = []
         try:
-            proc = subprocess_run(
+            subprocess_run(
                 command=command,
                 verbose=self._config.args.verbose,
                 msg=work,
                 output=self._output,
+                line_handler=lambda line: installed.extend(self.RE_GALAXY_INSTALLED.findall(line)),
             )
         except subprocess.CalledProcessError as exc:
             err = f"Failed to install collections: {exc} {exc.stderr}"
             self._output.critical(err)
 
-        installed = self.RE_GALAXY_INSTALLED.findall(proc.stdout)
         if not self._config.args.cpi:
             msg = f"Installed collections include: {oxford_join(installed)}"
         else:
@@ -260,7 +276,7 @@ class Installer:
         try:
             # Get the list of tracked files in the repository
             tracked_files_output = subprocess_run(
-                command="git ls-files 2> /dev/null",
+                command=["git", "ls-files"],
                 cwd=local_repo_path,
                 verbose=self._config.args.verbose,
                 msg=msg,
@@ -270,6 +286,10 @@ class Installer:
             err = f"Failed to list collection using git ls-files: {exc} {exc.stderr}"
             self._output.info(err)
             return None, None
+        except FileNotFoundError as exc:
+            err = f"Failed to list collection using git ls-files: {exc}"
+            self._output.info(err)
+            return None, None
 
         return "git ls-files", tracked_files_output.stdout
 
@@ -292,7 +312,7 @@ class Installer:
         try:
             # Get the list of tracked files in the repository
             tracked_files_output = subprocess_run(
-                command="ls 2> /dev/null",
+                command=["ls"],
                 cwd=local_repo_path,
                 verbose=self._config.args.verbose,
                 msg=msg,
@@ -302,23 +322,24 @@ class Installer:
             err = f"Failed to list collection using ls: {exc} {exc.stderr}"
             self._output.debug(err)
             return None, None
+        except FileNotFoundError as exc:
+            err = f"Failed to list collection using ls: {exc}"
+            self._output.debug(err)
+            return None, None
 
         return "ls", tracked_files_output.stdout
 
-    def _copy_repo_files(
-        self,
-        local_repo_path: Path,
-        destination_path: Path,
-    ) -> None:
-        """Copy collection files tracked in git to the build directory.
+    def _list_repo_files(self, local_repo_path: Path) -> tuple[str, list[str]]:
+        """List the collection files, preferring those tracked in git.
 
         Args:
             local_repo_path: The collection local path.
-            destination_path: The build destination path.
 
         Raises:
             SystemExit: If no files are found.
 
+        Returns:
+            The tool used to list the files and the file names
         """
         # Get tracked files from git ls-files command
         found_using, files_stdout = self._find_files_using_git_ls_files(
@@ -330,7 +351,7 @@ class Installer:
                 local_repo_path=local_repo_path,
             )
 
-        if not files_stdout:
+        if not found_using or not files_stdout:
             msg = "No files found with either 'git ls-files' or 'ls"
             self._output.critical(msg)
             raise SystemExit(msg)  # pragma: no cover # critical exits
@@ -338,26 +359,40 @@ class Installer:
         msg = f"File list generated with '{found_using}'"
         self._output.info(msg)
 
-        # Parse tracked files output
-        files_list = files_stdout.split("\n")
+        return found_using, [file for file in files_stdout.split("\n") if file]
+
+    def _copy_repo_files(
+        self,
+        local_repo_path: Path,
+        destination_path: Path,
+        files_list: list[str] | None = None,
+    ) -> None:
+        """Copy collection files tracked in git to the build directory.
+
+        Args:
+            local_repo_path: The collection local path.
+            destination_path: The build destination path.
+            files_list: The collection files, listed here when not given.
+        """
+        if files_list is None:
+            _found_using, files_list = self._list_repo_files(local_repo_path=local_repo_path)
 
-        # Create the destination folder if it doesn't exist
-        Path(destination_path).mkdir(parents=True, exist_ok=True)
+        # Create the destination folder and each parent directory once, not once per file
+        destination_dirs = {Path(destination_path)}
+        destination_dirs.update((Path(destination_path) / file).parent for file in files_list)
+        for destination_dir in sorted(destination_dirs):
+            destination_dir.mkdir(parents=True, exist_ok=True)
 
         for file in files_list:
             src_file_path = Path(local_repo_path) / file
             dest_file_path = Path(destination_path) / file
 
-            # Ensure the destination directory for the file exists
-            dest_file_path.parent.mkdir(parents=True, exist_ok=True)
-
-            if src_file_path.is_dir():
-                # Skip directories
-                continue
-
             try:
-                # Copy the file
-                shutil.copy2(src_file_path, dest_file_path)
+                # Copy the file and its permission bits, timestamps and xattrs are not needed
+                shutil.copy(src_file_path, dest_file_path)
+            except IsADirectoryError:
+                # Skip directories (ls output, git submodules) without a stat per file
+                continue
             except shutil.Error as exc:
                 err = f"Failed to copy collection to build directory: {exc}"
                 self._output.critical(err)
@@ -372,88 +407,72 @@ class Installer:
             collection: The collection object.
 
         Raises:
-            RuntimeError: If tarball is not found or if more than one tarball is found.
             SystemError: If the collection installation fails.
         """
         msg = f"Installing local collection from: {collection.build_dir}"
         self._output.info(msg)
 
-        self._copy_repo_files(
+        # The file list is shared by the fingerprint and the copy into the build directory
+        found_using, files_list = self._list_repo_files(local_repo_path=collection.path)
+        fingerprint = self._source_fingerprint(
             local_repo_path=collection.path,
-            destination_path=collection.build_dir,
-        )
-
-        command = (
-            f"cd {collection.build_dir} &&"
-            f" {self._config.galaxy_bin} collection build"
-            f" --output-path {collection.build_dir}"
-            " --force"
+            found_using=found_using,
+            files_list=files_list,
         )
+        build_stamp = collection.cache_dir / "build.stamp"
+        tarball = None
+        if (
+            fingerprint
+            and build_stamp.exists()
+            and build_stamp.read_text(encoding="utf-8") == fingerprint
+        ):
+            built = self._find_built_tarballs(build_dir=collection.build_dir)
+            if len(built) == 1:
+                msg = f"Collection source unchanged, reusing {built[0]}"
+                self._output.debug(msg)
+                tarball = built[0]
 
-        msg = "Running ansible-galaxy to build collection."
-        self._output.debug(msg)
-
-        try:
-            subprocess_run(
-                command=command,
-                verbose=self._config.args.verbose,
-                msg=msg,
-                output=self._output,
-            )
-        except subprocess.CalledProcessError as exc:
-            err = f"Failed to build collection: {exc} {exc.stderr}"
-            self._output.critical(err)
+        if tarball is None:
+            tarball = self._build_local_collection(collection=collection, files_list=files_list)
 
-        built = [
-            f
-            for f in Path(collection.build_dir).iterdir()
-            if f.is_file() and f.name.endswith(".tar.gz")
-        ]
-        if len(built) != 1:
-            err = (
-                "Expected to find one collection tarball in"
-                f"{collection.build_dir}, found {len(built)}"
-            )
-            raise RuntimeError(err)
-        tarball = built[0]
+        self._unlink_editable(collection.site_pkg_path)
 
-        if collection.site_pkg_path.exists():
-            msg = f"Removing installed {collection.site_pkg_path}"
-            self._output.debug(msg)
-            if collection.site_pkg_path.is_symlink():
-                collection.site_pkg_path.unlink()
-            else:
-                shutil.rmtree(collection.site_pkg_path)
-
-        info_dirs = [
-            entry
-            for entry in self._config.site_pkg_collections_path.iterdir()
-            if entry.is_dir()
-            and entry.name.endswith(".info")
-            and entry.name.startswith(collection.name)
-        ]
+        with os.scandir(self._config.site_pkg_collections_path) as entries:
+            info_dirs = [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.endswith(".info")
+                and entry.name.startswith(collection.name)
+                and entry.is_dir()
+            ]
         for info_dir in info_dirs:
             msg = f"Removing installed {info_dir}"
             self._output.debug(msg)
             shutil.rmtree(info_dir)
 
-        command = (
-            f"{self._config.galaxy_bin} collection"
-            f" install {tarball} -p {self._config.site_pkg_path}"
-            " --force"
-        )
+        command = [
+            str(self._config.galaxy_bin),
+            "collection",
+            "install",
+            str(tarball),
+            "-p",
+            str(self._config.site_pkg_path),
+            "--force",
+        ]
         env = {
             "ANSIBLE_GALAXY_COLLECTIONS_PATH_WARNING": str(self._config.args.verbose),
         }
         msg = "Running ansible-galaxy to install a local collection and it's dependencies."
         self._output.debug(msg)
+        installed: list[str] = []
         try:
-            proc = subprocess_run(
+            subprocess_run(
                 command=command,
                 env=env,
                 verbose=self._config.args.verbose,
                 msg=msg,
                 output=self._output,
+                line_handler=lambda line: installed.extend(self.RE_GALAXY_INSTALLED.findall(line)),
             )
         except subprocess.CalledProcessError as exc:
             err = f"Failed to install collection: {exc} {exc.stderr}"
@@ -463,21 +482,127 @@ class Installer:
         # ansible-galaxy collection install does not include the galaxy.yml for version
         # nor does it create an info file that can be used to determine the version.
         # preserve the MANIFEST.json file for editable installs
+        # Only the contents are needed, so skip the permission and metadata copy
         if not self._config.args.editable:
-            shutil.copy(
-                collection.build_dir / "galaxy.yml",
-                collection.site_pkg_path / "galaxy.yml",
+            (collection.site_pkg_path / "galaxy.yml").write_bytes(
+                (collection.build_dir / "galaxy.yml").read_bytes(),
             )
         else:
-            shutil.copy(
-                collection.site_pkg_path / "MANIFEST.json",
-                collection.cache_dir / "MANIFEST.json",
+            (collection.cache_dir / "MANIFEST.json").write_bytes(
+                (collection.site_pkg_path / "MANIFEST.json").read_bytes(),
             )
 
-        installed = self.RE_GALAXY_INSTALLED.findall(proc.stdout)
+        if fingerprint:
+            # Written only after a successful install, replace() keeps the update atomic
+            pending_stamp = build_stamp.with_suffix(".tmp")
+            pending_stamp.write_text(fingerprint, encoding="utf-8")
+            pending_stamp.replace(build_stamp)
+
         msg = f"Installed collections include: {oxford_join(installed)}"
         self._output.note(msg)
 
+    @staticmethod
+    def _source_fingerprint(
+        local_repo_path: Path,
+        found_using: str,
+        files_list: list[str],
+    ) -> str | None:
+        """Fingerprint the files tracked in a collection's git repository.
+
+        The fingerprint covers the source path and the name, size, mode and
+        modification time of every tracked file, so uncommitted changes and
+        another checkout of the same collection are picked up as well.
+
+        Args:
+            local_repo_path: The collection local path.
+            found_using: The tool used to list the collection files.
+            files_list: The collection files.
+
+        Returns:
+            The fingerprint or None if the collection is not a git repository
+        """
+        if found_using != "git ls-files":
+            return None
+
+        digest = hashlib.blake2b(f"{local_repo_path.resolve()}\n".encode(), digest_size=16)
+        for file in files_list:
+            try:
+                file_stat = (local_repo_path / file).stat()
+            except OSError:
+                return None
+            entry = f"{file}\0{file_stat.st_size}\0{file_stat.st_mode}\0{file_stat.st_mtime_ns}\n"
+            digest.update(entry.encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _find_built_tarballs(build_dir: Path) -> list[Path]:
+        """Find the collection tarballs in the build directory.
+
+        Args:
+            build_dir: The collection build directory.
+
+        Returns:
+            The collection tarballs
+        """
+        with os.scandir(build_dir) as entries:
+            return [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.endswith(".tar.gz") and entry.is_file()
+            ]
+
+    def _build_local_collection(self, collection: Collection, files_list: list[str]) -> Path:
+        """Copy the collection to the build directory and build it.
+
+        Args:
+            collection: The collection object.
+            files_list: The collection files to copy.
+
+        Raises:
+            RuntimeError: If tarball is not found or if more than one tarball is found.
+
+        Returns:
+            The collection tarball
+        """
+        self._copy_repo_files(
+            local_repo_path=collection.path,
+            destination_path=collection.build_dir,
+            files_list=files_list,
+        )
+
+        command = [
+            str(self._config.galaxy_bin),
+            "collection",
+            "build",
+            "--output-path",
+            str(collection.build_dir),
+            "--force",
+        ]
+
+        msg = "Running ansible-galaxy to build collection."
+        self._output.debug(msg)
+
+        try:
+            subprocess_run(
+                command=command,
+                cwd=collection.build_dir,
+                verbose=self._config.args.verbose,
+                msg=msg,
+                output=self._output,
+            )
+        except subprocess.CalledProcessError as exc:
+            err = f"Failed to build collection: {exc} {exc.stderr}"
+            self._output.critical(err)
+
+        built = self._find_built_tarballs(build_dir=collection.build_dir)
+        if len(built) != 1:
+            err = (
+                "Expected to find one collection tarball in"
+                f"{collection.build_dir}, found {len(built)}"
+            )
+            raise RuntimeError(err)
+        return built[0]
+
     def _swap_editable_collection(self, collection: Collection) -> None:
         """Swap the installed collection with the current working directory.
 
@@ -488,24 +613,78 @@ class Installer:
         msg = f"Swapping {collection.name} with {collection.path}"
         self._output.info(msg)
 
-        msg = f"Removing installed {collection.site_pkg_path}"
-        self._output.debug(msg)
-        if collection.site_pkg_path.exists():
-            if collection.site_pkg_path.is_symlink():
-                collection.site_pkg_path.unlink()
-            else:
-                shutil.rmtree(collection.site_pkg_path)
+        self._remove_installed(collection.site_pkg_path)
 
         msg = f"Symlinking {collection.site_pkg_path} to {collection.path}"
         self._output.debug(msg)
         collection.site_pkg_path.symlink_to(collection.path)
 
-    def _pip_install(self) -> None:
-        """Install the dependencies."""
+    def _remove_installed(self, path: Path) -> None:
+        """Remove an installed collection, symlinked or not.
+
+        A single lstat is used to determine both existence and type, rather than
+        separate exists() and is_symlink() calls.
+
+        Args:
+            path: The installed collection path.
+        """
+        try:
+            mode = path.lstat().st_mode
+        except FileNotFoundError:
+            return
+        msg = f"Removing installed {path}"
+        self._output.debug(msg)
+        if stat.S_ISLNK(mode):
+            path.unlink()
+        else:
+            shutil.rmtree(path)
+
+    def _unlink_editable(self, path: Path) -> None:
+        """Remove an editable install before ansible-galaxy installs over it.
+
+        Installed directories are left for ``ansible-galaxy --force`` to replace, only
+        a symlink to a source checkout is removed so galaxy does not write into it.
+
+        Args:
+            path: The installed collection path.
+        """
+        if path.is_symlink():
+            msg = f"Removing editable install {path}"
+            self._output.debug(msg)
+            path.unlink()
+
+    def _pip_install_cmd(self) -> list[str]:
+        """Build the pip install command for the virtual environment.
+
+        uv does not install into the interpreter it runs under, so it is
+        pointed at the virtual environment explicitly.
+
+        Returns:
+            The pip install command
+        """
+        if not self._config.uv:
+            return [str(self._config.venv_interpreter), "-m", "pip", "install"]
+        return [
+            *shlex.split(self._config.pip_cmd),
+            "install",
+            "--python",
+            str(self._config.venv_interpreter),
+        ]
+
+    def _pip_install(self, *, with_core: bool = False) -> None:
+        """Install the dependencies.
+
+        Args:
+            with_core: Install ansible-core in the same pip run if not installed already.
+        """
         msg = "Installing python requirements."
         self._output.info(msg)
 
-        command = f"{self._config.pip_cmd} install" f" -r {self._config.discovered_python_reqs}"
+        command = [*self._pip_install_cmd(), "-r", str(self._config.discovered_python_reqs)]
+        if with_core and not (self._config.venv_bindir / "ansible").exists():
+            msg = "Installing ansible-core with the python requirements."
+            self._output.debug(msg)
+            command.append("ansible-core")
 
         msg = f"Installing python requirements from {self._config.discovered_python_reqs}"
         self._output.debug(msg)
@@ -11,6 +11,8 @@ if TYPE_CHECKING:
     from ansible_dev_environment.config import Config
     from ansible_dev_environment.output import Output
 
+DEFAULT_LINK = "https://ansible.com"
+
 
 class Lister:
     """The Lister class."""
@@ -36,58 +38,66 @@ class Lister:
         column2_width = 10
         column3_width = 25
 
-        print(  # noqa: T201
-            f"{'Collection': <{column1_width}}"
-            f" {'Version': <{column2_width}}"
-            f" {'Editable project location': <{column3_width}}",
-        )
-        print(  # noqa: T201
-            f"{'-' * (column1_width)} {'-' * (column2_width)} {'-' * (column3_width)}",
-        )
+        # The first column may hold a terminal link, so it is padded by the caller
+        # using the length of the visible text
+        row = f"{{}} {{:<{column2_width}}} {{:<{column3_width}}}".format
+
+        # Rows are collected and written at once rather than printed one by one
+        lines = [
+            row("Collection".ljust(column1_width), "Version", "Editable project location"),
+            row("-" * column1_width, "-" * column2_width, "-" * column3_width),
+        ]
 
+        # The path property checks the directory exists on every access
+        collections_root = self._config.site_pkg_collections_path
+        term_features = self._config.term_features
+        links = term_features.links
         for fqcn, collection in collections.items():
             err = f"Collection {fqcn} has malformed metadata."
             ci = collection["collection_info"]
-            if not isinstance(ci, dict):
+            # Decoded JSON never holds subclasses, so exact type checks are enough
+            if type(ci) is not dict:
                 self._output.error(err)
                 continue
             collection_name = ci["name"]
             collection_namespace = ci["namespace"]
             collection_version = ci["version"]
-            if not isinstance(collection_name, str):
+            if type(collection_name) is not str:
                 self._output.error(err)
                 continue
-            if not isinstance(collection_namespace, str):
+            if type(collection_namespace) is not str:
                 self._output.error(err)
                 continue
-            if not isinstance(collection_version, str):
+            if type(collection_version) is not str:
                 self._output.error(err)
                 continue
 
-            collection_path = (
-                self._config.site_pkg_collections_path / collection_namespace / collection_name
-            )
-            if collection_path.is_symlink():
-                editable_location = str(collection_path.resolve())
-            else:
+            collection_path = collections_root / collection_namespace / collection_name
+            # Editable installs are symlinks, readlink fails for anything else
+            # which saves a separate is_symlink check per row
+            try:
+                link_target = collection_path.readlink()
+            except OSError:
                 editable_location = ""
-
-            docs = ci.get("documentation")
-            homepage = ci.get("homepage")
-            repository = ci.get("repository")
-            issues = ci.get("issues")
-            link = repository or homepage or docs or issues or "https://ansible.com"
+            else:
+                editable_location = str((collection_path.parent / link_target).resolve())
+
+            link = (
+                ci.get("repository")
+                or ci.get("homepage")
+                or ci.get("documentation")
+                or ci.get("issues")
+                or DEFAULT_LINK
+            )
             if not isinstance(link, str):
                 self._output.error(err)
-                link = "https://ansible.com"
-            fqcn_linked = term_link(
-                uri=link,
-                label=fqcn,
-                term_features=self._config.term_features,
-            )
+                link = DEFAULT_LINK
+            if links:
+                fqcn_linked = term_link(uri=link, label=fqcn, term_features=term_features)
+            else:
+                fqcn_linked = fqcn
 
-            print(  # noqa: T201
-                fqcn_linked + " " * (column1_width - len(fqcn)),
-                f"{ci['version']: <{column2_width}}",
-                f"{editable_location: <{column3_width}}",
-            )
+            padding = " " * (column1_width - len(fqcn))
+            lines.append(row(fqcn_linked + padding, collection_version, editable_location))
+
+        print("\n".join(lines))  # noqa: T201
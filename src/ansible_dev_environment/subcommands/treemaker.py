@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import re
+
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Union, cast
 
 from ansible_dev_environment.tree import Tree
@@ -18,6 +21,8 @@ JSONVal = ScalarVal | list["JSONVal"] | dict[str, "JSONVal"]
 TreeWithReqs = dict[str, Union[list[str], "TreeWithReqs"]]
 TreeWithoutReqs = dict[str, "TreeWithoutReqs"]
 
+RE_COMMENT_SPLIT = re.compile(r"[\s,]+")
+
 
 class TreeMaker:
     """Generate a dependency tree."""
@@ -32,57 +37,62 @@ class TreeMaker:
         self._config = config
         self._output = output
 
-    def run(self) -> None:  # noqa: C901, PLR0912, PLR0915
+    def run(self) -> None:  # noqa: C901, PLR0915
         """Run the command."""
         builder_introspect(self._config, self._output)
 
-        with self._config.discovered_python_reqs.open("r") as reqs_file:
-            python_deps = reqs_file.read().splitlines()
-
-        collections = collect_manifests(
-            target=self._config.site_pkg_collections_path,
-            venv_cache_dir=self._config.venv_cache_dir,
-        )
+        # The manifests are walked in the background while the requirements are read
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            manifests = executor.submit(
+                collect_manifests,
+                target=self._config.site_pkg_collections_path,
+                venv_cache_dir=self._config.venv_cache_dir,
+            )
+            python_deps = self._config.discovered_python_reqs.read_text().splitlines()
+            collections = manifests.result()
+        show_python_deps = self._config.args.verbose >= 1
+        python_deps_index = index_python_reqs(python_deps=python_deps) if show_python_deps else {}
         tree_dict: TreeWithoutReqs = {c: {} for c in collections}
 
         links: dict[str, str] = {}
         for collection_name, collection in collections.items():
-            err = f"Collection {collection_name} has malformed metadata."
-            if not isinstance(collection["collection_info"], dict):
-                self._output.error(err)
-                continue
-            if not isinstance(collection["collection_info"]["dependencies"], dict):
+            # Untrusted JSON, checked once here so the rest of the loop can rely on it
+            info = collection["collection_info"]
+            if not isinstance(info, dict) or not isinstance(info["dependencies"], dict):
+                err = f"Collection {collection_name} has malformed metadata."
                 self._output.error(err)
                 continue
 
-            for dep in collection["collection_info"]["dependencies"]:
+            target = tree_dict[collection_name]
+            for dep in info["dependencies"]:
                 if not isinstance(dep, str):
                     err = f"Collection {collection_name} has malformed dependency."
                     self._output.error(err)
                     continue
-                target = tree_dict[collection_name]
                 target[dep] = tree_dict[dep]
 
-            docs = collection["collection_info"].get("documentation")
-            homepage = collection["collection_info"].get("homepage")
-            repository = collection["collection_info"].get("repository")
-            issues = collection["collection_info"].get("issues")
             fallback = "https://ansible.com"
-            link = repository or homepage or docs or issues or fallback
+            link = (
+                info.get("repository")
+                or info.get("homepage")
+                or info.get("documentation")
+                or info.get("issues")
+                or fallback
+            )
             if not isinstance(link, str):
                 err = f"Collection {collection_name} has malformed repository metadata."
                 self._output.error(err)
                 link = fallback
             links[collection_name] = link
 
-            if self._config.args.verbose >= 1:
+            if show_python_deps:
                 add_python_reqs(
                     tree_dict=cast(TreeWithReqs, tree_dict),
                     collection_name=collection_name,
-                    python_deps=python_deps,
+                    python_deps=python_deps_index,
                 )
         green: list[str] = []
-        if self._config.args.verbose >= 1:
+        if show_python_deps:
             green.append("python requirements")
             for line in python_deps:
                 if "#" not in line:
@@ -97,14 +107,12 @@ class TreeMaker:
             rendered = tree.render()
             print(rendered)  # noqa: T201
         else:
-            pruned_tree_dict: TreeWithoutReqs = {}
-            for collection_name in tree_dict:
-                found = False
-                for value in tree_dict.values():
-                    if collection_name in value:
-                        found = True
-                if not found:
-                    pruned_tree_dict[collection_name] = tree_dict[collection_name]
+            has_parent = set().union(*tree_dict.values())
+            pruned_tree_dict: TreeWithoutReqs = {
+                collection_name: deps
+                for collection_name, deps in tree_dict.items()
+                if collection_name not in has_parent
+            }
 
             tree = Tree(
                 obj=cast(JSONVal, pruned_tree_dict),
@@ -115,7 +123,7 @@ class TreeMaker:
             rendered = tree.render()
             print(rendered)  # noqa: T201
 
-        if self._config.args.verbose >= 1:
+        if show_python_deps:
             msg = "Only direct python dependencies are shown."
             self._output.info(msg)
             hint = "Run `pip show <pkg>` to see indirect dependencies."
@@ -125,14 +133,14 @@ class TreeMaker:
 def add_python_reqs(
     tree_dict: TreeWithReqs,
     collection_name: str,
-    python_deps: list[str],
+    python_deps: dict[str, list[str]],
 ) -> None:
     """Add Python dependencies to the tree.
 
     Args:
         tree_dict: The tree dict.
         collection_name: The collection name.
-        python_deps: The Python dependencies.
+        python_deps: The Python dependencies indexed by collection name.
 
     Raises:
         TypeError: If the tree dict is not a dict.
@@ -142,14 +150,25 @@ def add_python_reqs(
         msg = "Did you really name a collection 'python requirements'?"
         raise TypeError(msg)
 
-    deps = []
-    for dep in sorted(python_deps):
-        if "#" in dep:
-            name, comment = dep.split("#", 1)
-        else:
-            name = dep
-            comment = ""
-        if collection_name in comment:
-            deps.append(name.strip())
+    collection["python requirements"] = list(python_deps.get(collection_name, []))
+
+
+def index_python_reqs(python_deps: list[str]) -> dict[str, list[str]]:
+    """Index the Python dependencies by the collections named in their comments.
+
+    Each line is expected to look like "name  # from collection ns.name", the comment
+    is split on whitespace and commas and every word becomes a key.
 
-    collection["python requirements"] = deps
+    Args:
+        python_deps: The Python dependencies, one requirement per line.
+
+    Returns:
+        The sorted requirement names for each word found in the comments.
+    """
+    index: dict[str, list[str]] = {}
+    for dep in sorted(python_deps):
+        name, _sep, comment = dep.partition("#")
+        for word in set(RE_COMMENT_SPLIT.split(comment)):
+            if word:
+                index.setdefault(word, []).append(name.strip())
+    return index
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import shutil
 
 from pathlib import Path
@@ -11,7 +12,7 @@ from ansible_dev_environment.collection import (
     Collection,
     parse_collection_request,
 )
-from ansible_dev_environment.utils import collections_from_requirements
+from ansible_dev_environment.utils import collections_from_requirements, fast_rmtree
 
 
 if TYPE_CHECKING:
@@ -32,6 +33,7 @@ class UnInstaller:
         self._config = config
         self._output = output
         self._collection: Collection
+        self._info_dirs: dict[str, list[Path]] = {}
 
     def run(self) -> None:
         """Run the uninstaller."""
@@ -39,6 +41,7 @@ class UnInstaller:
             msg = "Only one collection can be uninstalled at a time."
             self._output.critical(msg)
 
+        self._info_dirs = self._find_info_dirs()
         if self._config.args.requirement:
             requirements_path = Path(self._config.args.requirement)
             if not requirements_path.exists():
@@ -60,53 +63,72 @@ class UnInstaller:
             )
             self._remove_collection()
 
-    def _remove_collection(self) -> None:
+    def _find_info_dirs(self) -> dict[str, list[Path]]:
+        """Find the info directories of the installed collections.
+
+        The collections root is listed once, the directories are named
+        <namespace>.<name>-<version>.info and are indexed by collection name.
+
+        Returns:
+            The info directories for each collection name.
+        """
+        info_dirs: dict[str, list[Path]] = {}
+        with os.scandir(self._config.site_pkg_collections_path) as entries:
+            for entry in entries:
+                if entry.name.endswith(".info") and entry.is_dir(follow_symlinks=False):
+                    name = entry.name.partition("-")[0]
+                    info_dirs.setdefault(name, []).append(Path(entry.path))
+        return info_dirs
+
+    def _remove_collection(self) -> None:  # noqa: C901
         """Remove the collection."""
-        msg = f"Checking {self._collection.name} at {self._collection.site_pkg_path}"
-        self._output.debug(msg)
+        debug = self._output.debug_enabled
+        if debug:
+            msg = f"Checking {self._collection.name} at {self._collection.site_pkg_path}"
+            self._output.debug(msg)
 
         if self._collection.site_pkg_path.exists():
-            msg = f"Exists: {self._collection.site_pkg_path}"
-            self._output.debug(msg)
+            if debug:
+                msg = f"Exists: {self._collection.site_pkg_path}"
+                self._output.debug(msg)
 
             if self._collection.site_pkg_path.is_symlink():
                 self._collection.site_pkg_path.unlink()
             else:
-                shutil.rmtree(self._collection.site_pkg_path)
+                fast_rmtree(self._collection.site_pkg_path)
             msg = f"Removed {self._collection.name}"
             self._output.note(msg)
         else:
             err = f"Failed to find {self._collection.name}: {self._collection.site_pkg_path}"
             self._output.warning(err)
 
-        for entry in self._config.site_pkg_collections_path.iterdir():
-            if all(
-                (
-                    entry.is_dir(),
-                    entry.name.startswith(self._collection.name),
-                    entry.suffix == ".info",
-                ),
-            ):
-                shutil.rmtree(entry)
-                msg = f"Removed {self._collection.name}*.info: {entry}"
+        # The .info directories hold a few files, a rm process would cost more
+        for info_dir in self._info_dirs.pop(self._collection.name, []):
+            shutil.rmtree(info_dir)
+            if debug:
+                msg = f"Removed {self._collection.name}*.info: {info_dir}"
                 self._output.debug(msg)
 
         collection_namespace_root = self._collection.site_pkg_path.parent
 
-        if collection_namespace_root.exists():
-            try:
-                collection_namespace_root.rmdir()
-                msg = f"Removed collection namespace root: {collection_namespace_root}"
-                self._output.debug(msg)
-            except OSError as exc:
-                msg = f"Failed to remove collection namespace root: {exc}"
-                self._output.debug(msg)
+        # rmdir reports a missing directory itself, no need to check first
+        try:
+            collection_namespace_root.rmdir()
+            msg = f"Removed collection namespace root: {collection_namespace_root}"
+            self._output.debug(msg)
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            msg = f"Failed to remove collection namespace root: {exc}"
+            self._output.debug(msg)
 
-        if self._config.site_pkg_collections_path.exists():
-            try:
-                self._config.site_pkg_collections_path.rmdir()
-                msg = f"Removed collection root: {self._config.site_pkg_collections_path}"
-                self._output.debug(msg)
-            except OSError as exc:
-                msg = f"Failed to remove collection root: {exc}"
-                self._output.debug(msg)
+        collections_root = self._config.site_pkg_collections_path
+        try:
+            collections_root.rmdir()
+            msg = f"Removed collection root: {collections_root}"
+            self._output.debug(msg)
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            msg = f"Failed to remove collection root: {exc}"
+            self._output.debug(msg)
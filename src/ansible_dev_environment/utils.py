@@ -2,23 +2,29 @@
 
 from __future__ import annotations
 
+import hashlib
 import itertools
 import json
 import logging
+import os
+import shlex
+import shutil
 import subprocess
 import sys
 import threading
 import time
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, cast
 
 import subprocess_tee
 import yaml
 
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from collections.abc import Callable
     from types import TracebackType
 
     from .config import Config
@@ -27,6 +33,19 @@ if TYPE_CHECKING:
 from typing import Any
 
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover
+    HAS_ORJSON = False
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+
 logger = logging.getLogger(__name__)
 
 
@@ -112,16 +131,20 @@ class Ansi:
     GREY = "\x1b[90m"
 
 
-def subprocess_run(  # pylint: disable=too-many-positional-arguments
-    command: str,
+def subprocess_run(  # noqa: PLR0913  # pylint: disable=too-many-positional-arguments
+    command: str | list[str],
     verbose: int,
     msg: str,
     output: Output,
     cwd: Path | None = None,
     env: dict[str, str] | None = None,
+    line_handler: Callable[[str], None] | None = None,
+    capture_stdout: bool = True,  # noqa: FBT001, FBT002
 ) -> subprocess.CompletedProcess[str]:
     """Run a subprocess command.
 
+    A command given as a list is executed directly, a string is run through the shell.
+
     Args:
         command: The command to run
         verbose: The verbosity level
@@ -129,33 +152,138 @@ def subprocess_run(  # pylint: disable=too-many-positional-arguments
         output: The output object
         cwd: The current working directory
         env: The environment variables
+        line_handler: Called with each line of stdout as it is produced, stdout is not retained
+        capture_stdout: Whether to collect stdout, otherwise it is discarded unless debugging
     Returns:
         The completed process
     """
-    cmd = f"Running command: {command}"
+    shell = isinstance(command, str)
+    cmd = f"Running command: {command if shell else shlex.join(command)}"
     output.debug(cmd)
     log_level = logging.ERROR - (verbose * 10)
+    if line_handler is not None:
+        if log_level == logging.DEBUG:
+            return _subprocess_stream(
+                command=command,
+                cwd=cwd,
+                env=env,
+                line_handler=line_handler,
+                echo=True,
+            )
+        with Spinner(message=msg, term_features=output.term_features):
+            return _subprocess_stream(
+                command=command,
+                cwd=cwd,
+                env=env,
+                line_handler=line_handler,
+                echo=False,
+            )
     if log_level == logging.DEBUG:
-        return subprocess_tee.run(  # noqa: S604
+        return subprocess_tee.run(
             command,
             check=True,
             cwd=cwd,
             env=env,
-            shell=True,
+            shell=shell,
             text=True,
         )
     with Spinner(message=msg, term_features=output.term_features):
-        return subprocess.run(  # noqa: S602
+        return subprocess.run(  # noqa: S603
             command,
             check=True,
             cwd=cwd,
             env=env,
-            shell=True,
-            capture_output=True,
+            shell=shell,
+            stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
         )
 
 
+def _subprocess_stream(
+    command: str | list[str],
+    cwd: Path | None,
+    env: dict[str, str] | None,
+    line_handler: Callable[[str], None],
+    echo: bool,  # noqa: FBT001
+) -> subprocess.CompletedProcess[str]:
+    """Run a subprocess command, handing stdout to a callback line by line.
+
+    Args:
+        command: The command to run
+        cwd: The current working directory
+        env: The environment variables
+        line_handler: Called with each line of stdout
+        echo: Whether to echo stdout and stderr to the terminal
+    Returns:
+        The completed process, stdout is always empty
+    Raises:
+        CalledProcessError: If the command exits with a non-zero return code
+        RuntimeError: If the pipes to the subprocess could not be opened
+    """
+    stderr_lines: list[str] = []
+
+    def drain_stderr(stream: IO[str]) -> None:
+        """Collect stderr in the background so it cannot block the stdout pipe.
+
+        Args:
+            stream: The stderr stream
+        """
+        for line in stream:
+            if echo:
+                sys.stderr.write(line)
+            stderr_lines.append(line)
+
+    with subprocess.Popen(  # noqa: S603
+        command,
+        cwd=cwd,
+        env=env,
+        shell=isinstance(command, str),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    ) as proc:
+        if proc.stdout is None or proc.stderr is None:  # pragma: no cover
+            err = "Failed to open pipes to the subprocess"
+            raise RuntimeError(err)
+        drain = threading.Thread(target=drain_stderr, args=(proc.stderr,))
+        drain.start()
+        for line in proc.stdout:
+            if echo:
+                sys.stdout.write(line)
+            line_handler(line)
+        drain.join()
+        returncode = proc.wait()
+
+    stderr = "".join(stderr_lines)
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, command, output="", stderr=stderr)
+    return subprocess.CompletedProcess(command, returncode, stdout="", stderr=stderr)
+
+
+def fast_rmtree(path: Path) -> None:
+    """Remove a large directory tree.
+
+    rm -rf is used where available, it avoids the per entry interpreter overhead
+    of shutil.rmtree on large trees. shutil.rmtree is the fallback and reports
+    any error. Starting rm costs more than removing a small directory, use
+    shutil.rmtree directly for those.
+
+    Args:
+        path: The directory to remove
+    """
+    rm_bin = shutil.which("rm") if sys.platform != "win32" else None
+    if rm_bin:
+        proc = subprocess.run(  # noqa: S603
+            [rm_bin, "-rf", "--", str(path)],
+            check=False,
+            capture_output=True,
+        )
+        if proc.returncode == 0:
+            return
+    shutil.rmtree(path)
+
+
 def oxford_join(words: list[str]) -> str:
     """Join a list of words with commas and an oxford comma.
 
@@ -183,21 +311,24 @@ def opt_deps_to_files(collection_path: Path, dep_str: str) -> list[Path]:
     Returns:
         A list of files
     """
+    with os.scandir(collection_path) as entries:
+        file_names = {entry.name for entry in entries if entry.is_file()}
+
     deps = dep_str.split(",")
     files = []
     for dep in deps:
         _dep = dep.strip()
-        variant1 = collection_path / f"{_dep}-requirements.txt"
-        if variant1.exists():
-            files.append(variant1)
+        variant1 = f"{_dep}-requirements.txt"
+        if variant1 in file_names:
+            files.append(collection_path / variant1)
             continue
-        variant2 = collection_path / f"requirements-{_dep}.txt"
-        if variant2.exists():
-            files.append(variant2)
+        variant2 = f"requirements-{_dep}.txt"
+        if variant2 in file_names:
+            files.append(collection_path / variant2)
             continue
         msg = (
             f"Failed to find optional dependency file for '{_dep}'."
-            f" Checked for '{variant1.name}' and '{variant2.name}'. Skipping."
+            f" Checked for '{variant1}' and '{variant2}'. Skipping."
         )
         logger.error(msg)
     return files
@@ -206,21 +337,159 @@ def opt_deps_to_files(collection_path: Path, dep_str: str) -> list[Path]:
 def sort_dict(item: dict[str, Any]) -> dict[str, Any]:
     """Recursively sort a dictionary.
 
+    Nested dictionaries are handled with an explicit stack rather than recursion.
+
     Args:
         item: The dictionary to sort.
 
     Returns:
         The sorted dictionary.
     """
-    return {k: sort_dict(v) if isinstance(v, dict) else v for k, v in sorted(item.items())}
+    result: dict[str, Any] = {}
+    stack = [(item, result)]
+    while stack:
+        source, dest = stack.pop()
+        for key, value in sorted(source.items()):
+            if isinstance(value, dict):
+                dest[key] = {}
+                stack.append((value, dest[key]))
+            else:
+                dest[key] = value
+    return result
+
+
+def _collection_manifest(
+    cname: str,
+    name_dir: str,
+    venv_cache_dir: Path,
+) -> dict[str, JSONVal] | None:
+    """Load the manifest and requirement files of one installed collection.
+
+    Args:
+        cname: The collection name.
+        name_dir: The installed collection directory.
+        venv_cache_dir: The directory to look for manifests in.
+
+    Returns:
+        The manifest or None if not found.
+    """
+    manifest = Path(name_dir) / "MANIFEST.json"
+    if not manifest.exists():
+        manifest = venv_cache_dir / cname / "MANIFEST.json"
+    if not manifest.exists():
+        msg = f"Manifest not found for {cname}"
+        logger.debug(msg)
+        return None
+    if HAS_ORJSON:
+        manifest_json = orjson.loads(manifest.read_bytes())
+    else:
+        with manifest.open() as manifest_file:
+            manifest_json = json.load(manifest_file)
+
+    c_info = manifest_json.get("collection_info", {})
+    if not c_info:
+        manifest_json["collection_info"] = {}
+        c_info = manifest_json["collection_info"]
+    c_info["requirements"] = {"python": {}, "system": []}
+
+    python_requirements = c_info["requirements"]["python"]
+    system_requirements = c_info["requirements"]["system"]
+
+    with os.scandir(name_dir) as file_entries:
+        txt_files = [
+            entry for entry in file_entries if entry.name.endswith(".txt") and entry.is_file()
+        ]
+    for file in txt_files:
+        stem = file.name[: -len(".txt")]
+        if "requirements" in file.name:
+            requirements = Path(file.path).read_text().splitlines()
+            python_requirements[stem] = requirements
+        if stem == "bindep":
+            requirements = Path(file.path).read_text().splitlines()
+            system_requirements.extend(requirements)
+    return cast("dict[str, JSONVal]", manifest_json)
+
+
+# Manifests of installed collections, reused while their directories are unchanged
+MANIFEST_CACHE = "manifests.json"
+
+
+def _read_manifest_cache(cache_file: Path) -> dict[str, Any]:
+    """Read the cached manifests.
+
+    Args:
+        cache_file: The cache file.
+
+    Returns:
+        The cached entries by collection name, empty if missing or unreadable.
+    """
+    try:
+        content = cache_file.read_bytes()
+        cached = orjson.loads(content) if HAS_ORJSON else json.loads(content)
+    except (OSError, ValueError):
+        return {}
+    return cached if isinstance(cached, dict) else {}
+
+
+def _write_manifest_cache(cache_file: Path, entries: dict[str, Any]) -> None:
+    """Write the cached manifests, replacing the previous file atomically.
+
+    Args:
+        cache_file: The cache file.
+        entries: The entries by collection name.
+    """
+    content = orjson.dumps(entries) if HAS_ORJSON else json.dumps(entries).encode()
+    pending = cache_file.with_suffix(".tmp")
+    try:
+        pending.write_bytes(content)
+        pending.replace(cache_file)
+    except OSError as exc:
+        msg = f"Failed to write manifest cache: {exc}"
+        logger.debug(msg)
 
 
-def collect_manifests(  # noqa: C901
+def _manifest_stamp(cname: str, name_dir: str, venv_cache_dir: Path) -> str:
+    """Fingerprint the files an installed collection's manifest is built from.
+
+    Args:
+        cname: The collection name.
+        name_dir: The installed collection directory.
+        venv_cache_dir: The directory to look for manifests in.
+
+    Returns:
+        The fingerprint
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    candidates = [
+        Path(name_dir),
+        Path(name_dir) / "MANIFEST.json",
+        venv_cache_dir / cname / "MANIFEST.json",
+    ]
+    with os.scandir(name_dir) as file_entries:
+        candidates.extend(
+            sorted(Path(entry.path) for entry in file_entries if entry.name.endswith(".txt"))
+        )
+    for candidate in candidates:
+        try:
+            stat = candidate.stat()
+        except OSError:
+            continue
+        digest.update(f"{candidate}\0{stat.st_mtime_ns}\0{stat.st_ino}\0{stat.st_size}\n".encode())
+    return digest.hexdigest()
+
+
+def collect_manifests(
     target: Path,
     venv_cache_dir: Path,
 ) -> dict[str, dict[str, JSONVal]]:
     """Collect manifests from a target directory.
 
+    Each installed collection's manifest is cached, keyed by the stat of its
+    directory, its MANIFEST.json and the requirement files read with it, so an
+    edit in place is picked up. Editable collections are symlinks to a source
+    tree and are always read. The remaining collections are read on a thread
+    pool so their file reads overlap.
+
     Args:
         target: The target directory to collect manifests from.
         venv_cache_dir: The directory to look for manifests in.
@@ -228,68 +497,151 @@ def collect_manifests(  # noqa: C901
     Returns:
         A dictionary of manifests.
     """
-    collections = {}
-    for namespace_dir in target.iterdir():
-        if not namespace_dir.is_dir():
+    with os.scandir(target) as namespace_entries:
+        namespace_dirs = [entry for entry in namespace_entries if entry.is_dir()]
+
+    found: list[tuple[str, os.DirEntry[str]]] = []
+    for namespace_dir in namespace_dirs:
+        with os.scandir(namespace_dir.path) as name_entries:
+            found.extend(
+                (f"{namespace_dir.name}.{entry.name}", entry)
+                for entry in name_entries
+                if entry.is_dir()
+            )
+
+    cache_file = venv_cache_dir / MANIFEST_CACHE
+    cached = _read_manifest_cache(cache_file)
+    entries: dict[str, Any] = {}
+    collections: dict[str, dict[str, JSONVal]] = {}
+    pending: list[tuple[str, str, str | None]] = []
+    for cname, entry in found:
+        if entry.is_symlink():
+            pending.append((cname, entry.path, None))
             continue
-
-        for name_dir in namespace_dir.iterdir():
-            if not name_dir.is_dir():
-                continue
-            manifest = name_dir / "MANIFEST.json"
-            if not manifest.exists():
-                manifest = (
-                    venv_cache_dir / f"{namespace_dir.name}.{name_dir.name}" / "MANIFEST.json"
-                )
-            if not manifest.exists():
-                msg = f"Manifest not found for {namespace_dir.name}.{name_dir.name}"
-                logger.debug(msg)
+        stamp = _manifest_stamp(cname=cname, name_dir=entry.path, venv_cache_dir=venv_cache_dir)
+        hit = cached.get(cname)
+        if isinstance(hit, dict) and hit.get("key") == stamp:
+            collections[cname] = hit["manifest"]
+            entries[cname] = hit
+        else:
+            pending.append((cname, entry.path, stamp))
+
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        manifests = executor.map(
+            lambda item: _collection_manifest(
+                cname=item[0],
+                name_dir=item[1],
+                venv_cache_dir=venv_cache_dir,
+            ),
+            pending,
+        )
+        changed = entries.keys() != cached.keys()
+        for (cname, _name_dir, read_stamp), manifest in zip(pending, manifests, strict=True):
+            if manifest is None:
                 continue
-            with manifest.open() as manifest_file:
-                manifest_json = json.load(manifest_file)
-
-            cname = f"{namespace_dir.name}.{name_dir.name}"
-
-            collections[cname] = manifest_json
-            c_info = collections[cname].get("collection_info", {})
-            if not c_info:
-                collections[cname]["collection_info"] = {}
-                c_info = collections[cname]["collection_info"]
-            c_info["requirements"] = {"python": {}, "system": []}
-
-            python_requirements = c_info["requirements"]["python"]
-            system_requirements = c_info["requirements"]["system"]
-
-            for file in name_dir.iterdir():
-                if not file.is_file():
-                    continue
-                if not file.name.endswith(".txt"):
-                    continue
-                if "requirements" in file.name:
-                    with file.open() as requirements_file:
-                        requirements = requirements_file.read().splitlines()
-                        python_requirements[file.stem] = requirements
-                if file.stem == "bindep":
-                    with file.open() as requirements_file:
-                        requirements = requirements_file.read().splitlines()
-                        system_requirements.extend(requirements)
+            collections[cname] = manifest
+            if read_stamp is not None:
+                entries[cname] = {"key": read_stamp, "manifest": manifest}
+                changed = True
+
+    if changed:
+        _write_manifest_cache(cache_file, entries)
 
     return sort_dict(collections)
 
 
+# Execution environment files, their dependencies may name other requirement files
+EE_FILES = (
+    "meta/execution-environment.yml",
+    "meta/execution-environment.yaml",
+)
+# Files read by ansible-builder introspect within each installed collection
+INTROSPECT_FILES = (
+    "requirements.txt",
+    "bindep.txt",
+    *EE_FILES,
+)
+
+
+def _ee_dependency_files(collection_path: Path) -> list[Path]:
+    """List the requirement files named in a collection's execution environment file.
+
+    Args:
+        collection_path: The installed collection path.
+
+    Returns:
+        The requirement files, empty if there is no readable execution environment file.
+    """
+    for name in EE_FILES:
+        try:
+            content = (collection_path / name).read_bytes()
+        except OSError:
+            continue
+        try:
+            ee_file = yaml.load(content, Loader=SafeLoader)
+        except yaml.YAMLError:
+            return []
+        dependencies = ee_file.get("dependencies") if isinstance(ee_file, dict) else None
+        if not isinstance(dependencies, dict):
+            return []
+        # Inline lists are part of the execution environment file itself
+        return [
+            collection_path / value for value in dependencies.values() if isinstance(value, str)
+        ]
+    return []
+
+
+def _introspect_fingerprint(
+    command: list[str],
+    collections_path: Path,
+    extra_files: list[Path],
+) -> str:
+    """Fingerprint the inputs of ansible-builder introspect.
+
+    Args:
+        command: The introspect command.
+        collections_path: The installed collections path.
+        extra_files: Additional requirement files passed to introspect.
+
+    Returns:
+        The fingerprint
+    """
+    digest = hashlib.blake2b(shlex.join(command).encode(), digest_size=16)
+    candidates = [collections_path, *extra_files]
+    for collection_path in sorted(collections_path.glob("*/*")):
+        candidates.append(collection_path)
+        candidates.extend(collection_path / name for name in INTROSPECT_FILES)
+        candidates.extend(_ee_dependency_files(collection_path))
+    for candidate in candidates:
+        try:
+            mtime_ns = candidate.stat().st_mtime_ns
+        except OSError:
+            continue
+        digest.update(f"{candidate}\0{mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
 def builder_introspect(config: Config, output: Output) -> None:
     """Introspect a collection.
 
+    The introspection is skipped when none of the installed collections or their
+    requirement files changed since the discovered requirements were last written.
+
     Args:
         config: The configuration object.
         output: The output object.
     """
-    command = (
-        f"ansible-builder introspect {config.site_pkg_path}"
-        f" --write-pip {config.discovered_python_reqs}"
-        f" --write-bindep {config.discovered_bindep_reqs}"
-        " --sanitize"
-    )
+    command = [
+        "ansible-builder",
+        "introspect",
+        str(config.site_pkg_path),
+        "--write-pip",
+        str(config.discovered_python_reqs),
+        "--write-bindep",
+        str(config.discovered_bindep_reqs),
+        "--sanitize",
+    ]
+    dep_paths: list[Path] = []
     if (
         hasattr(config.args, "collection_specifier")
         and hasattr(config, "collection")
@@ -301,7 +653,23 @@ def builder_introspect(config: Config, output: Output) -> None:
             dep_str=config.collection.opt_deps,
         )
         for dep_path in dep_paths:
-            command += f" --user-pip {dep_path}"
+            command.extend(["--user-pip", str(dep_path)])
+    fingerprint = _introspect_fingerprint(
+        command=command,
+        collections_path=config.site_pkg_collections_path,
+        extra_files=dep_paths,
+    )
+    introspect_stamp = config.venv_cache_dir / "introspect.stamp"
+    if (
+        config.discovered_python_reqs.exists()
+        and config.discovered_bindep_reqs.exists()
+        and introspect_stamp.exists()
+        and introspect_stamp.read_text() == fingerprint
+    ):
+        msg = "Installed collections unchanged, reusing discovered requirements."
+        logger.debug(msg)
+        return
+
     msg = f"Writing discovered python requirements to: {config.discovered_python_reqs}"
     logger.debug(msg)
     msg = f"Writing discovered system requirements to: {config.discovered_bindep_reqs}"
@@ -313,10 +681,15 @@ def builder_introspect(config: Config, output: Output) -> None:
             verbose=config.args.verbose,
             msg=work,
             output=output,
+            capture_stdout=False,
         )
     except subprocess.CalledProcessError as exc:
         err = f"Failed to discover requirements: {exc} {exc.stderr}"
         logger.critical(err)
+    else:
+        pending_stamp = introspect_stamp.with_suffix(".tmp")
+        pending_stamp.write_text(fingerprint)
+        pending_stamp.replace(introspect_stamp)
 
     if not config.discovered_python_reqs.exists():
         config.discovered_python_reqs.touch()
@@ -333,20 +706,18 @@ def collections_from_requirements(file: Path) -> list[dict[str, str]]:
     Returns:
         A list of collections
     """
-    collections = []
     try:
-        with file.open() as requirements_file:
-            requirements = yaml.safe_load(requirements_file)
+        # The raw bytes are handed to the loader, the reader detects the encoding
+        requirements = yaml.load(file.read_bytes(), Loader=SafeLoader)
     except yaml.YAMLError as exc:
         err = f"Failed to load yaml file: {exc}"
         logger.critical(err)
 
-    for requirement in requirements["collections"]:
-        if isinstance(requirement, str):
-            collections.append({"name": requirement})
-        elif isinstance(requirement, dict):
-            collections.append(requirement)
-    return collections
+    return [
+        {"name": requirement} if isinstance(requirement, str) else requirement
+        for requirement in requirements["collections"]
+        if isinstance(requirement, str | dict)
+    ]
 
 
 def collections_meta(config: Config) -> dict[str, dict[str, Any]]:
@@ -358,38 +729,39 @@ def collections_meta(config: Config) -> dict[str, dict[str, Any]]:
     Returns:
         A dictionary of metadata about installed collections.
     """
-    all_info_dirs = [
-        entry
-        for entry in config.site_pkg_collections_path.iterdir()
-        if entry.name.endswith(".info")
-    ]
+    # A single listing is split into namespace and info directories, the latter
+    # are named <namespace>.<name>-<version>.info
+    namespace_dirs: list[os.DirEntry[str]] = []
+    info_dirs: dict[str, os.DirEntry[str]] = {}
+    with os.scandir(config.site_pkg_collections_path) as entries:
+        for entry in entries:
+            if entry.name.endswith(".info"):
+                info_dirs.setdefault(entry.name.partition("-")[0], entry)
+            elif entry.is_dir():
+                namespace_dirs.append(entry)
 
     collections = {}
-    for namespace_dir in config.site_pkg_collections_path.iterdir():
-        if not namespace_dir.is_dir():
-            continue
+    for namespace_dir in namespace_dirs:
+        with os.scandir(namespace_dir.path) as name_entries:
+            name_dirs = [entry for entry in name_entries if entry.is_dir()]
 
-        for name_dir in namespace_dir.iterdir():
-            if not name_dir.is_dir():
-                continue
-            some_info_dirs = [
-                info_dir
-                for info_dir in all_info_dirs
-                if f"{namespace_dir.name}.{name_dir.name}" in info_dir.name
-            ]
+        for name_dir in name_dirs:
+            info_dir = info_dirs.get(f"{namespace_dir.name}.{name_dir.name}")
             file = None
             editable_location = ""
-            if some_info_dirs:
-                file = some_info_dirs[0] / "GALAXY.yml"
+            if info_dir:
+                file = Path(info_dir.path) / "GALAXY.yml"
                 editable_location = ""
 
-            elif (name_dir / "galaxy.yml").exists():
-                file = name_dir / "galaxy.yml"
-                editable_location = str(name_dir.resolve()) if name_dir.is_symlink() else ""
+            elif (Path(name_dir.path) / "galaxy.yml").exists():
+                file = Path(name_dir.path) / "galaxy.yml"
+                editable_location = (
+                    str(Path(name_dir.path).resolve()) if name_dir.is_symlink() else ""
+                )
 
             if file:
                 with file.open() as info_file:
-                    info = yaml.safe_load(info_file)
+                    info = yaml.load(info_file, Loader=SafeLoader)
                     collections[f"{namespace_dir.name}.{name_dir.name}"] = {
                         "version": info.get("version", "unknown"),
                         "editable_location": editable_location,
@@ -420,27 +792,26 @@ class Spinner:  # pylint: disable=too-many-instance-attributes
             term_features: Terminal features
             delay: The delay between characters
         """
-        self._spinner = itertools.cycle(("|", "/", "-", "\\", "|", "/", "-"))
+        chars: tuple[str, ...] = ("|", "/", "-", "\\", "|", "/", "-")
+        if term_features.color:
+            chars = tuple(f"{Ansi.GREY}{char}{Ansi.RESET}" for char in chars)
+        # Each frame steps back over itself so the next one overwrites it in place
+        self._spinner = itertools.cycle(tuple(f"{char}\b" for char in chars))
         self.delay = delay
-        self.busy = False
         self.spinner_visible = False
         self._term_features = term_features
-        self._screen_lock = threading.Lock()
+        # Only the spinner thread writes while it runs, the context handler
+        # writes again after joining it, so no lock is needed around stdout
+        self._stop = threading.Event()
         self._start_time: float | None = None
         self.thread: threading.Thread
         self.msg: str = message.rstrip(".").rstrip(":").rstrip()
 
     def write_next(self) -> None:
         """Write the next char."""
-        with self._screen_lock:
-            if not self.spinner_visible:
-                if self._term_features.color:
-                    char = f"{Ansi.GREY}{next(self._spinner)}{Ansi.RESET}"
-                else:
-                    char = next(self._spinner)
-                sys.stdout.write(char)
-                self.spinner_visible = True
-                sys.stdout.flush()
+        sys.stdout.write(next(self._spinner))
+        self.spinner_visible = True
+        sys.stdout.flush()
 
     def remove_spinner(
         self,
@@ -453,22 +824,18 @@ class Spinner:  # pylint: disable=too-many-instance-attributes
         Args:
             cleanup: Should we cleanup after the spinner
         """
-        with self._screen_lock:
-            if self.spinner_visible:
-                sys.stdout.write("\b")
-                self.spinner_visible = False
-                if cleanup:
-                    sys.stdout.write(" ")  # overwrite spinner with blank
-                    sys.stdout.write("\r")  # move to next line
-                    sys.stdout.write("\033[K")  # clear line
+        if self.spinner_visible:
+            self.spinner_visible = False
+            if cleanup:
+                # overwrite spinner with blank, move to line start, clear line
+                sys.stdout.write(" \r\033[K")
                 sys.stdout.flush()
 
     def spinner_task(self) -> None:
         """Spin the spinner."""
-        while self.busy:
+        self.write_next()
+        while not self._stop.wait(self.delay):
             self.write_next()
-            time.sleep(self.delay)
-            self.remove_spinner()
 
     def __enter__(self) -> None:
         """Enter the context handler."""
@@ -483,7 +850,7 @@ class Spinner:  # pylint: disable=too-many-instance-attributes
         # hide the cursor
         sys.stdout.write("\033[?25l")
         if self._term_features.any_enabled():
-            self.busy = True
+            self._stop.clear()
             self.thread = threading.Thread(target=self.spinner_task)
             self.thread.start()
 
@@ -511,7 +878,8 @@ class Spinner:  # pylint: disable=too-many-instance-attributes
             if elapsed < min_show_time:
                 time.sleep(min_show_time - elapsed)
         if self._term_features.any_enabled():
-            self.busy = False
+            self._stop.set()
+            self.thread.join()
             self.remove_spinner(cleanup=True)
         else:
             sys.stdout.write("\r")
@@ -7,7 +7,6 @@ import pytest
 from ansible_dev_environment.arg_parser import (
     ArgumentParser,
     CustomHelpFormatter,
-    _group_titles,
 )
 
 
@@ -88,7 +87,22 @@ def test_group_no_title(capsys: pytest.CaptureFixture[str]) -> None:
         formatter_class=CustomHelpFormatter,
     )
     parser.add_argument_group()
-    _group_titles(parser)
     parser.print_help()
     captured = capsys.readouterr()
     assert "--help" in captured.out
+
+
+def test_group_titles(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test group titles are capitalized, including those copied from a parent.
+
+    Args:
+        capsys: Pytest fixture.
+    """
+    parent = ArgumentParser(add_help=False)
+    parent.add_argument("--parent", help="From the parent")
+    parser = ArgumentParser(formatter_class=CustomHelpFormatter, parents=[parent])
+    parser.add_argument("positional", help="A positional")
+    parser.print_help()
+    captured = capsys.readouterr()
+    assert "Positional arguments:" in captured.out
+    assert captured.out.count("Options:") == 1
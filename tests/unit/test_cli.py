@@ -3,15 +3,10 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import TYPE_CHECKING
 
 import pytest
 
-from ansible_dev_environment.cli import Cli, main
-
-
-if TYPE_CHECKING:
-    from collections.abc import Generator
+from ansible_dev_environment.cli import Cli, _has_entries, main
 
 
 def test_cpi(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -181,39 +176,21 @@ def test_collections_in_user(
         monkeypatch: Pytest fixture.
     """
     usr_path = Path("/usr/share/ansible/collections")
-    exists = Path.exists
 
-    def _exists(path: Path) -> bool:
-        """Patch the exists method.
+    def _usr_has_entries(path: Path) -> bool:
+        """Patch the directory check.
 
         Args:
             path: Path object.
 
         Returns:
-            bool: True if the path exists.
+            bool: True if the directory has entries.
         """
         if path == usr_path:
             return True
-        return exists(path)
-
-    monkeypatch.setattr(Path, "exists", _exists)
-
-    iterdir = Path.iterdir
-
-    def _iterdir(path: Path) -> list[Path] | Generator[Path, None, None]:
-        """Patch the iterdir method.
-
-        Args:
-            path: Path object.
-
-        Returns:
-            List of paths or generator.
-        """
-        if path == usr_path:
-            return [usr_path / "ansible_collections"]
-        return iterdir(path)
+        return _has_entries(path)
 
-    monkeypatch.setattr(Path, "iterdir", _iterdir)
+    monkeypatch.setattr("ansible_dev_environment.cli._has_entries", _usr_has_entries)
 
     monkeypatch.setattr(
         "sys.argv",
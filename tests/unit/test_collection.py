@@ -129,3 +129,36 @@ def test_get_galaxy_corrupt(
 
     captured = capsys.readouterr()
     assert "Failed to load yaml file:" in captured.err
+
+
+def test_build_dir_created_once(tmp_path: Path, output: Output) -> None:
+    """Test the cache and build directories are created on first access only.
+
+    Args:
+        tmp_path: Temporary directory.
+        output: Output class object.
+    """
+    config = Config(
+        args=Namespace(venv=str(tmp_path / "venv")),
+        term_features=TermFeatures(color=False, links=False),
+        output=output,
+    )
+    collection = Collection(
+        config=config,
+        path=tmp_path,
+        cname="utils",
+        cnamespace="ansible",
+        local=True,
+        original=str(tmp_path),
+        specifier="",
+        opt_deps="",
+        csource=[],
+    )
+    build_dir = collection.build_dir
+    assert build_dir == config.venv_cache_dir / "ansible.utils" / "build"
+    assert build_dir.is_dir()
+    assert collection.cache_dir == build_dir.parent
+
+    build_dir.rmdir()
+    assert collection.build_dir == build_dir
+    assert not build_dir.exists()
@@ -450,7 +450,7 @@ def test_sys_packages_path_fail_call(
             The completed process.
 
         """
-        if "sysconfig.get_paths" in kwargs["command"]:
+        if "sysconfig.get_paths" in " ".join(kwargs["command"]):
             raise subprocess.CalledProcessError(1, kwargs["command"])
         return orig_subprocess_run(*args, **kwargs)
 
@@ -493,7 +493,7 @@ def test_sys_packages_path_fail_invalid_json(
             The completed process.
 
         """
-        if "sysconfig.get_paths" in kwargs["command"]:
+        if "sysconfig.get_paths" in " ".join(kwargs["command"]):
             return subprocess.CompletedProcess(
                 args=kwargs["command"],
                 returncode=0,
@@ -541,7 +541,7 @@ def test_sys_packages_path_fail_empty(
             The completed process.
 
         """
-        if "sysconfig.get_paths" in kwargs["command"]:
+        if "sysconfig.get_paths" in " ".join(kwargs["command"]):
             return subprocess.CompletedProcess(
                 args=kwargs["command"],
                 returncode=0,
@@ -589,7 +589,7 @@ def test_sys_packages_path_missing_purelib(
             The completed process.
 
         """
-        if "sysconfig.get_paths" in kwargs["command"]:
+        if "sysconfig.get_paths" in " ".join(kwargs["command"]):
             response = {
                 "stdlib": "/usr/lib64/python3.12",
                 "platstdlib": "/home/user/ansible-dev-environment/venv/lib64/python3.12",
@@ -617,3 +617,43 @@ def test_sys_packages_path_missing_purelib(
 
     assert exc.value.code == 1
     assert "Failed to find purelib in sysconfig paths" in capsys.readouterr().err
+
+
+def test_site_pkg_path_cached(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    output: Output,
+) -> None:
+    """Test the site packages path is reused from the cache.
+
+    Args:
+        tmp_path: A temporary directory.
+        monkeypatch: A pytest fixture for patching.
+        output: The output fixture.
+    """
+    args = gen_args(venv=str(tmp_path / "test_venv"))
+    config = Config(args=args, output=output, term_features=output.term_features)
+    config.init()
+    assert (config.venv_cache_dir / "site_packages.json").exists()
+
+    def mock_subprocess_run(
+        *args: Any,  # noqa: ANN401, ARG001
+        **kwargs: Any,  # noqa: ANN401, ARG001
+    ) -> subprocess.CompletedProcess[str]:
+        """Fail if the venv interpreter is asked for its paths.
+
+        Args:
+            *args: The positional arguments.
+            **kwargs: The keyword arguments.
+
+        Raises:
+            AssertionError: Always
+        """
+        msg = "The site packages path should come from the cache."
+        raise AssertionError(msg)
+
+    monkeypatch.setattr("ansible_dev_environment.config.subprocess_run", mock_subprocess_run)
+
+    cached_config = Config(args=args, output=output, term_features=output.term_features)
+    cached_config.init()
+    assert cached_config.site_pkg_path == config.site_pkg_path
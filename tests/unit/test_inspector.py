@@ -8,15 +8,19 @@ import json
 import re
 import sys
 
+from argparse import Namespace
 from typing import TYPE_CHECKING
 
+from ansible_dev_environment.config import Config
 from ansible_dev_environment.subcommands import inspector
 
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     import pytest
 
-    from ansible_dev_environment.config import Config
+    from ansible_dev_environment.output import Output
 
 
 def test_output_no_color(session_venv: Config, capsys: pytest.CaptureFixture[str]) -> None:
@@ -89,3 +93,31 @@ def test_no_rich(
     assert "ansible.posix" in data
     assert "ansible.scm" in data
     assert "ansible.utils" in data
+
+
+def test_output_plain(tmp_path: Path, output: Output, capsys: pytest.CaptureFixture[str]) -> None:
+    """Test the plain output keeps the 4 space indented, ASCII escaped format.
+
+    Args:
+        tmp_path: Pytest fixture.
+        output: The output fixture.
+        capsys: Pytest capture fixture.
+    """
+    config = Config(
+        args=Namespace(verbose=0, venv=str(tmp_path / "venv")),
+        output=output,
+        term_features=output.term_features,
+    )
+    config.site_pkg_path = tmp_path / "site-packages"
+    config.site_pkg_path.mkdir()
+    collection = config.site_pkg_collections_path / "ns" / "name"
+    collection.mkdir(parents=True)
+    manifest = {"collection_info": {"version": "1.0.0", "authors": ["Jos\u00e9"]}}
+    (collection / "MANIFEST.json").write_text(json.dumps(manifest))
+
+    _inspector = inspector.Inspector(config=config, output=output)
+    _inspector.run()
+    captured = capsys.readouterr()
+    data = json.loads(captured.out)
+    assert data["ns.name"]["collection_info"]["authors"] == ["Jos\u00e9"]
+    assert captured.out == json.dumps(data, indent=4, sort_keys=True) + "\n"
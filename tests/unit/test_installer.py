@@ -212,6 +212,115 @@ def test_copy_using_ls(tmp_path: Path, output: Output) -> None:
     assert sorted([m.name for m in list(moved)]) == ["file1.txt", "file2.txt"]
 
 
+def test_copy_using_git_nested(tmp_path: Path, output: Output) -> None:
+    """Test file copy using git with nested directories.
+
+    Args:
+        tmp_path: Temp directory
+        output: Output instance
+    """
+    source = tmp_path / "source"
+    (source / "plugins" / "modules").mkdir(parents=True)
+    (source / "empty").mkdir()
+    dest = tmp_path / "build"
+    config = Config(args=NAMESPACE, output=output, term_features=output.term_features)
+    installer = Installer(output=output, config=config)
+    subprocess.run(args=["git", "init"], cwd=source, check=False)
+    (source / "galaxy.yml").touch()
+    (source / "plugins" / "modules" / "module.py").touch()
+    subprocess.run(args=["git", "add", "--all"], cwd=source, check=False)
+    installer._copy_repo_files(local_repo_path=source, destination_path=dest)
+    moved = [m.relative_to(dest) for m in dest.glob("**/*") if m.is_file()]
+    assert sorted(moved) == [Path("galaxy.yml"), Path("plugins/modules/module.py")]
+    assert not (dest / "empty").exists()
+
+
+def test_copy_using_ls_skips_dirs(tmp_path: Path, output: Output) -> None:
+    """Test file copy using ls skips directories.
+
+    Args:
+        tmp_path: Temp directory
+        output: Output instance
+    """
+    source = tmp_path / "source"
+    (source / "plugins").mkdir(parents=True)
+    dest = tmp_path / "build"
+    dest.mkdir()
+    config = Config(args=NAMESPACE, output=output, term_features=output.term_features)
+    installer = Installer(output=output, config=config)
+    (source / "file1.txt").touch()
+    (source / "plugins" / "file2.txt").touch()
+    installer._copy_repo_files(local_repo_path=source, destination_path=dest)
+    assert sorted(m.name for m in dest.iterdir()) == ["file1.txt"]
+
+
+def test_copy_keeps_mode(tmp_path: Path, output: Output) -> None:
+    """Test file copy keeps the executable bit used by ansible-galaxy build.
+
+    Args:
+        tmp_path: Temp directory
+        output: Output instance
+    """
+    source = tmp_path / "source"
+    source.mkdir()
+    dest = tmp_path / "build"
+    config = Config(args=NAMESPACE, output=output, term_features=output.term_features)
+    installer = Installer(output=output, config=config)
+    script = source / "script.sh"
+    script.touch()
+    script.chmod(0o755)
+    installer._copy_repo_files(local_repo_path=source, destination_path=dest)
+    assert os.access(dest / "script.sh", os.X_OK)
+
+
+def test_source_fingerprint(tmp_path: Path, output: Output) -> None:
+    """Test the source fingerprint tracks changes to git tracked files.
+
+    Args:
+        tmp_path: Temp directory
+        output: Output instance
+    """
+    config = Config(args=NAMESPACE, output=output, term_features=output.term_features)
+    installer = Installer(output=output, config=config)
+    tracked = tmp_path / "source" / "file.txt"
+    tracked.parent.mkdir()
+    tracked.write_text("one")
+
+    def fingerprint(local_repo_path: Path) -> str | None:
+        """Fingerprint a collection source the way a local install does.
+
+        Args:
+            local_repo_path: The collection source
+
+        Returns:
+            The fingerprint
+        """
+        found_using, files_list = installer._list_repo_files(local_repo_path=local_repo_path)
+        return installer._source_fingerprint(
+            local_repo_path=local_repo_path,
+            found_using=found_using,
+            files_list=files_list,
+        )
+
+    assert fingerprint(tracked.parent) is None
+
+    subprocess.run(args=["git", "init"], cwd=tracked.parent, check=False)
+    subprocess.run(args=["git", "add", "--all"], cwd=tracked.parent, check=False)
+    first = fingerprint(tracked.parent)
+    assert first
+    assert fingerprint(tracked.parent) == first
+
+    (tracked.parent / "untracked.txt").touch()
+    assert fingerprint(tracked.parent) == first
+
+    checkout = tmp_path / "checkout"
+    shutil.copytree(tracked.parent, checkout, copy_function=shutil.copy2)
+    assert fingerprint(checkout) != first
+
+    tracked.write_text("two!")
+    assert fingerprint(tracked.parent) != first
+
+
 def test_copy_fails(
     tmp_path: Path,
     output: Output,
@@ -235,7 +344,7 @@ def test_copy_fails(
     (source / "file1.txt").touch()
     (source / "file2.txt").touch()
 
-    def mock_copy2(src: Path, dest: Path) -> None:  # noqa: ARG001
+    def mock_copy(src: Path, dest: Path) -> None:  # noqa: ARG001
         """Raise an exception.
 
         Args:
@@ -248,7 +357,7 @@ def test_copy_fails(
         """
         raise shutil.Error
 
-    monkeypatch.setattr(shutil, "copy2", mock_copy2)
+    monkeypatch.setattr(shutil, "copy", mock_copy)
     with pytest.raises(SystemExit) as excinfo:
         installer._copy_repo_files(local_repo_path=source, destination_path=dest)
 
@@ -670,7 +779,7 @@ def test_install_fails(
             The completed process
 
         """
-        if "install 'ansible.posix'" in kwargs["command"]:
+        if "install ansible.posix" in " ".join(kwargs["command"]):
             raise subprocess.CalledProcessError(1, kwargs["command"])
         return subprocess_run(**kwargs)
 
@@ -1052,7 +1161,7 @@ def test_local_collection_build_fails(
             The completed process
 
         """
-        if "collection build" in kwargs["command"]:
+        if "collection build" in " ".join(kwargs["command"]):
             raise subprocess.CalledProcessError(1, kwargs["command"])
         return subprocess_run(**kwargs)
 
@@ -1110,7 +1219,7 @@ def test_local_collection_build_no_tar(
             A completed process
 
         """
-        if "collection build" in kwargs["command"]:
+        if "collection build" in " ".join(kwargs["command"]):
             return subprocess.CompletedProcess(
                 args=kwargs["command"],
                 returncode=0,
@@ -1176,7 +1285,7 @@ def test_local_collection_install_fails(
             The completed process
 
         """
-        if "collection install" in kwargs["command"]:
+        if "collection install" in " ".join(kwargs["command"]):
             raise subprocess.CalledProcessError(1, kwargs["command"])
         return subprocess_run(**kwargs)
 
@@ -1278,7 +1387,7 @@ def test_failed_pip_install(
             The completed process
 
         """
-        if "pip install" in kwargs["command"]:
+        if "pip install" in " ".join(kwargs["command"]):
             raise subprocess.CalledProcessError(1, kwargs["command"])
         return subprocess_run(**kwargs)
 
@@ -1292,3 +1401,92 @@ def test_failed_pip_install(
 
     captured = capsys.readouterr()
     assert "Failed to install requirements from" in captured.err
+
+
+@pytest.mark.parametrize("core_installed", (True, False), ids=("installed", "missing"))
+def test_pip_install_with_core(
+    tmp_path: Path,
+    output: Output,
+    monkeypatch: pytest.MonkeyPatch,
+    core_installed: bool,  # noqa: FBT001
+) -> None:
+    """Test ansible-core is added to the requirements pip run only when missing.
+
+    Args:
+        tmp_path: Temp directory
+        output: Output instance
+        monkeypatch: The monkeypatch fixture
+        core_installed: Whether ansible-core is already in the venv
+    """
+    commands: list[list[str]] = []
+
+    def mock_subprocess_run(**kwargs: Any) -> None:  # noqa: ANN401
+        """Record the command.
+
+        Args:
+            **kwargs: Keyword arguments
+        """
+        commands.append(kwargs["command"])
+
+    monkeypatch.setattr(
+        "ansible_dev_environment.subcommands.installer.subprocess_run",
+        mock_subprocess_run,
+    )
+    args = Namespace(verbose=0, venv=str(tmp_path / "venv"))
+    config = Config(args=args, output=output, term_features=output.term_features)
+    config.venv_interpreter = config.venv_bindir / "python"
+    if core_installed:
+        config.venv_bindir.mkdir(parents=True)
+        (config.venv_bindir / "ansible").touch()
+    installer = Installer(output=output, config=config)
+    installer._pip_install(with_core=True)
+    assert commands[0][:5] == [str(config.venv_interpreter), "-m", "pip", "install", "-r"]
+    assert ("ansible-core" in commands[0]) is not core_installed
+
+
+def test_pip_install_cmd_uv(tmp_path: Path, output: Output) -> None:
+    """Test uv is pointed at the virtual environment interpreter.
+
+    Args:
+        tmp_path: Temp directory
+        output: Output instance
+    """
+    args = Namespace(verbose=0, venv=str(tmp_path / "venv"))
+    config = Config(args=args, output=output, term_features=output.term_features)
+    config.uv = True
+    config.pip_cmd = "python -m uv pip"
+    config.venv_interpreter = config.venv_bindir / "python"
+    installer = Installer(output=output, config=config)
+    assert installer._pip_install_cmd() == [
+        "python",
+        "-m",
+        "uv",
+        "pip",
+        "install",
+        "--python",
+        str(config.venv_interpreter),
+    ]
+
+
+def test_unlink_editable(tmp_path: Path, output: Output) -> None:
+    """Test only an editable symlink is removed ahead of a galaxy install.
+
+    Args:
+        tmp_path: Temp directory
+        output: Output instance
+    """
+    config = Config(args=NAMESPACE, output=output, term_features=output.term_features)
+    installer = Installer(output=output, config=config)
+    installed = tmp_path / "installed"
+    installed.mkdir()
+    (installed / "galaxy.yml").touch()
+    editable = tmp_path / "editable"
+    editable.symlink_to(installed)
+
+    installer._unlink_editable(installed)
+    installer._unlink_editable(editable)
+    installer._unlink_editable(tmp_path / "missing")
+
+    assert (installed / "galaxy.yml").exists()
+    assert not editable.exists()
+    assert not editable.is_symlink()
@@ -102,3 +102,27 @@ def test_output_log_exists(tmp_path: Path) -> None:
     assert pre_stat.st_size > 0
     assert post_stat.st_size != pre_stat.st_size
     assert post_stat.st_size == 0
+
+
+@pytest.mark.parametrize(
+    ("log_level", "verbosity", "expected"),
+    (("notset", 0, False), ("notset", 2, True), ("debug", 0, True)),
+    ids=("quiet", "verbose", "logged"),
+)
+def test_debug_enabled(log_level: str, verbosity: int, expected: bool, tmp_path: Path) -> None:  # noqa: FBT001
+    """Test debug messages are reported as enabled when printed or logged.
+
+    Args:
+        log_level: Log level.
+        verbosity: Verbosity level.
+        expected: Whether debug messages are expected to be enabled.
+        tmp_path: Pytest fixture.
+    """
+    output = Output(
+        log_file=str(tmp_path / "test.log"),
+        log_level=log_level,
+        log_append="false",
+        term_features=TermFeatures(color=False, links=False),
+        verbosity=verbosity,
+    )
+    assert output.debug_enabled is expected
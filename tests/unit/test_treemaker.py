@@ -9,7 +9,12 @@ from venv import EnvBuilder
 import pytest
 
 from ansible_dev_environment.config import Config
-from ansible_dev_environment.subcommands.treemaker import TreeMaker, TreeWithReqs, add_python_reqs
+from ansible_dev_environment.subcommands.treemaker import (
+    TreeMaker,
+    TreeWithReqs,
+    add_python_reqs,
+    index_python_reqs,
+)
 
 
 if TYPE_CHECKING:
@@ -356,4 +361,18 @@ def test_collection_is_a_list() -> None:
     """Confirm a TypeError is the collection isn't a dict."""
     tree_dict: TreeWithReqs = {"test_collection": []}
     with pytest.raises(TypeError):
-        add_python_reqs(tree_dict, "test_collection", ["xmltodict"])
+        add_python_reqs(tree_dict, "test_collection", {"test_collection": ["xmltodict"]})
+
+
+def test_index_python_reqs() -> None:
+    """Confirm requirements are indexed by exact collection name."""
+    python_deps = [
+        "xmltodict  # from collection ansible.utils",
+        "jmespath  # from collection ansible.utils,community.general",
+        "netaddr  # from collection ansible.util",
+        "requests",
+    ]
+    index = index_python_reqs(python_deps)
+    assert index["ansible.utils"] == ["jmespath", "xmltodict"]
+    assert index["community.general"] == ["jmespath"]
+    assert index["ansible.util"] == ["netaddr"]
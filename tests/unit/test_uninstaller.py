@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import copy
 
+from argparse import Namespace
 from typing import TYPE_CHECKING
 
 import pytest
@@ -106,3 +107,29 @@ def test_editable_uninstall(
     captured = capsys.readouterr()
     assert "Removed ansible.posix" in captured.out
     assert "Failed to find ansible.posix" in captured.out
+
+
+def test_requirements_info_dirs(tmp_path: Path, output: Output) -> None:
+    """Test each collection in a requirements file has only its info directory removed.
+
+    Args:
+        tmp_path: The tmp_path fixture.
+        output: The output fixture.
+    """
+    requirements = tmp_path / "requirements.yml"
+    requirements.write_text("collections:\n  - ansible.utils\n  - ansible.posix\n")
+    config = Config(
+        args=Namespace(collection_specifier=[], requirement=str(requirements), verbose=0),
+        output=output,
+        term_features=output.term_features,
+    )
+    config.site_pkg_path = tmp_path / "site-packages"
+    root = config.site_pkg_path / "ansible_collections"
+    for name in ("utils", "posix", "windows"):
+        (root / "ansible" / name).mkdir(parents=True)
+        (root / f"ansible.{name}-1.0.0.info").mkdir()
+
+    UnInstaller(config=config, output=output).run()
+
+    assert sorted(path.name for path in root.iterdir()) == ["ansible", "ansible.windows-1.0.0.info"]
+    assert [path.name for path in (root / "ansible").iterdir()] == ["windows"]
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import os
+import subprocess
+
 from argparse import Namespace
 from pathlib import Path
 
@@ -13,7 +16,17 @@ from ansible_dev_environment.collection import (
 )
 from ansible_dev_environment.config import Config
 from ansible_dev_environment.output import Output
-from ansible_dev_environment.utils import TermFeatures
+from ansible_dev_environment.utils import (
+    TermFeatures,
+    builder_introspect,
+    collect_manifests,
+    collections_from_requirements,
+    collections_meta,
+    fast_rmtree,
+    opt_deps_to_files,
+    sort_dict,
+    subprocess_run,
+)
 
 
 term_features = TermFeatures(color=False, links=False)
@@ -123,3 +136,290 @@ def test_parse_collection_request(scenario: tuple[str, Collection | None]) -> No
             parse_collection_request(string=string, config=config, output=output)
     else:
         assert parse_collection_request(string=string, config=config, output=output) == spec
+
+
+@pytest.mark.parametrize("verbose", (0, 3), ids=("spinner", "debug"))
+def test_subprocess_run_line_handler(verbose: int) -> None:
+    """Test that stdout is handed to the line handler line by line.
+
+    Args:
+        verbose: The verbosity level.
+    """
+    lines: list[str] = []
+    proc = subprocess_run(
+        command="echo one; echo two; echo three >&2",
+        verbose=verbose,
+        msg="Streaming",
+        output=output,
+        line_handler=lines.append,
+    )
+    assert lines == ["one\n", "two\n"]
+    assert proc.stdout == ""
+    assert proc.stderr == "three\n"
+
+
+def test_subprocess_run_line_handler_fails() -> None:
+    """Test that a failing streamed command raises with stderr collected."""
+    with pytest.raises(subprocess.CalledProcessError) as exc_info:
+        subprocess_run(
+            command="echo oops >&2; exit 3",
+            verbose=0,
+            msg="Streaming",
+            output=output,
+            line_handler=lambda _line: None,
+        )
+    assert exc_info.value.returncode == 3  # noqa: PLR2004
+    assert exc_info.value.stderr == "oops\n"
+
+
+def test_subprocess_run_argv() -> None:
+    """Test that a command given as a list is not split by a shell."""
+    proc = subprocess_run(
+        command=["printf", "%s", "a b; echo c"],
+        verbose=0,
+        msg="Running",
+        output=output,
+    )
+    assert proc.stdout == "a b; echo c"
+
+
+def test_subprocess_run_discard_stdout() -> None:
+    """Test stdout can be discarded while stderr is still collected."""
+    proc = subprocess_run(
+        command="echo out; echo err >&2",
+        verbose=0,
+        msg="Running",
+        output=output,
+        capture_stdout=False,
+    )
+    assert proc.stdout is None
+    assert proc.stderr == "err\n"
+
+
+def test_builder_introspect_reused(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test introspection is skipped until an installed collection changes.
+
+    Args:
+        tmp_path: A temporary directory
+        monkeypatch: The monkeypatch fixture
+    """
+    commands: list[list[str]] = []
+
+    def mock_subprocess_run(**kwargs: list[str]) -> None:
+        """Record the command and write the requirement files.
+
+        Args:
+            **kwargs: Keyword arguments
+        """
+        commands.append(kwargs["command"])
+        local_config.discovered_python_reqs.write_text("xmltodict\n")
+        local_config.discovered_bindep_reqs.write_text("")
+
+    monkeypatch.setattr("ansible_dev_environment.utils.subprocess_run", mock_subprocess_run)
+    local_config = Config(
+        args=Namespace(verbose=0, venv=str(tmp_path / "venv")),
+        term_features=term_features,
+        output=output,
+    )
+    local_config.site_pkg_path = tmp_path / "site-packages"
+    local_config.site_pkg_path.mkdir()
+    collection_path = local_config.site_pkg_collections_path / "ansible" / "utils"
+    collection_path.mkdir(parents=True)
+
+    builder_introspect(config=local_config, output=output)
+    builder_introspect(config=local_config, output=output)
+    assert len(commands) == 1
+    assert commands[0][:2] == ["ansible-builder", "introspect"]
+
+    (collection_path / "requirements.txt").write_text("xmltodict\n")
+    builder_introspect(config=local_config, output=output)
+    assert len(commands) == 2  # noqa: PLR2004
+
+    # A requirement file named by the execution environment file is tracked too
+    (collection_path / "meta").mkdir()
+    ee_requirements = collection_path / "meta" / "ee-requirements.txt"
+    ee_requirements.write_text("jmespath\n")
+    (collection_path / "meta" / "execution-environment.yml").write_text(
+        "dependencies:\n  python: meta/ee-requirements.txt\n",
+    )
+    builder_introspect(config=local_config, output=output)
+    assert len(commands) == 3  # noqa: PLR2004
+
+    mtime_ns = ee_requirements.stat().st_mtime_ns + 1_000_000_000
+    os.utime(ee_requirements, ns=(mtime_ns, mtime_ns))
+    builder_introspect(config=local_config, output=output)
+    assert len(commands) == 4  # noqa: PLR2004
+
+
+def test_fast_rmtree(tmp_path: Path) -> None:
+    """Test a directory tree is removed.
+
+    Args:
+        tmp_path: A temporary directory
+    """
+    tree = tmp_path / "tree"
+    (tree / "nested").mkdir(parents=True)
+    (tree / "nested" / "file.txt").touch()
+    fast_rmtree(tree)
+    assert not tree.exists()
+    assert tmp_path.exists()
+
+
+def test_collect_manifests(tmp_path: Path) -> None:
+    """Test manifests and requirement files are collected for each collection.
+
+    Args:
+        tmp_path: A temporary directory
+    """
+    target = tmp_path / "ansible_collections"
+    cache = tmp_path / "cache"
+    installed = target / "ns" / "installed"
+    installed.mkdir(parents=True)
+    (installed / "MANIFEST.json").write_text('{"collection_info": {"version": "1.0.0"}}')
+    (installed / "requirements.txt").write_text("xmltodict\n")
+    (installed / "bindep.txt").write_text("gcc\n")
+    editable = target / "ns" / "editable"
+    editable.mkdir()
+    (cache / "ns.editable").mkdir(parents=True)
+    (cache / "ns.editable" / "MANIFEST.json").write_text("{}")
+    (target / "ns" / "missing").mkdir()
+
+    collections = collect_manifests(target=target, venv_cache_dir=cache)
+
+    assert list(collections) == ["ns.editable", "ns.installed"]
+    assert collections["ns.installed"]["collection_info"] == {
+        "requirements": {"python": {"requirements": ["xmltodict"]}, "system": ["gcc"]},
+        "version": "1.0.0",
+    }
+    assert collections["ns.editable"]["collection_info"] == {
+        "requirements": {"python": {}, "system": []},
+    }
+
+
+@pytest.mark.parametrize("has_orjson", (True, False), ids=("orjson", "json"))
+def test_collect_manifests_cached(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    *,
+    has_orjson: bool,
+) -> None:
+    """Test installed manifests are cached until the collection's files change.
+
+    Args:
+        tmp_path: A temporary directory
+        monkeypatch: Pytest fixture
+        has_orjson: Whether orjson is used to read and write JSON
+    """
+    if has_orjson:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr("ansible_dev_environment.utils.HAS_ORJSON", has_orjson)
+    target = tmp_path / "ansible_collections"
+    cache = tmp_path / "cache"
+    cache.mkdir()
+    installed = target / "ns" / "installed"
+    installed.mkdir(parents=True)
+    (installed / "MANIFEST.json").write_text('{"collection_info": {"version": "1.0.0"}}')
+
+    (installed / "requirements.txt").write_text("foo\n")
+
+    first = collect_manifests(target=target, venv_cache_dir=cache)
+    assert (cache / "manifests.json").exists()
+    assert collect_manifests(target=target, venv_cache_dir=cache) == first
+
+    (installed / "requirements.txt").write_text("foo\nbar>=1.0\n")
+    edited = collect_manifests(target=target, venv_cache_dir=cache)
+    assert edited["ns.installed"]["collection_info"] == {
+        "requirements": {"python": {"requirements": ["foo", "bar>=1.0"]}, "system": []},
+        "version": "1.0.0",
+    }
+
+    (installed / "MANIFEST.json").write_text('{"collection_info": {"version": "1.1.0"}}')
+    edited = collect_manifests(target=target, venv_cache_dir=cache)
+    assert edited["ns.installed"]["collection_info"] == {
+        "requirements": {"python": {"requirements": ["foo", "bar>=1.0"]}, "system": []},
+        "version": "1.1.0",
+    }
+
+    fast_rmtree(installed)
+    installed.mkdir()
+    (installed / "MANIFEST.json").write_text('{"collection_info": {"version": "2.0.0"}}')
+    replaced = collect_manifests(target=target, venv_cache_dir=cache)
+    assert replaced["ns.installed"]["collection_info"] == {
+        "requirements": {"python": {}, "system": []},
+        "version": "2.0.0",
+    }
+
+
+def test_opt_deps_to_files(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    """Test both optional dependency file name variants are found.
+
+    Args:
+        tmp_path: A temporary directory
+        caplog: The log capture fixture
+    """
+    (tmp_path / "test-requirements.txt").touch()
+    (tmp_path / "requirements-lint.txt").touch()
+    files = opt_deps_to_files(collection_path=tmp_path, dep_str="test, lint,docs")
+    assert files == [tmp_path / "test-requirements.txt", tmp_path / "requirements-lint.txt"]
+    assert "Failed to find optional dependency file for 'docs'" in caplog.text
+
+
+def test_sort_dict() -> None:
+    """Test nested dictionaries are sorted at every level."""
+    item = {"b": {"d": 1, "c": {"f": [2, 1], "e": None}}, "a": "x"}
+    result = sort_dict(item)
+    assert result == item
+    assert list(result) == ["a", "b"]
+    assert list(result["b"]) == ["c", "d"]
+    assert list(result["b"]["c"]) == ["e", "f"]
+    assert result["b"]["c"]["f"] == [2, 1]
+
+
+def test_collections_meta(tmp_path: Path) -> None:
+    """Test metadata is read from the matching info directory or galaxy.yml.
+
+    Args:
+        tmp_path: A temporary directory
+    """
+    local_config = Config(
+        args=Namespace(verbose=0, venv=str(tmp_path / "venv")),
+        term_features=term_features,
+        output=output,
+    )
+    local_config.site_pkg_path = tmp_path / "site-packages"
+    root = local_config.site_pkg_path / "ansible_collections"
+    (root / "ansible" / "util").mkdir(parents=True)
+    (root / "ansible" / "utils").mkdir()
+    (root / "ansible.utils-2.0.0.info").mkdir()
+    (root / "ansible.utils-2.0.0.info" / "GALAXY.yml").write_text("version: 2.0.0\n")
+    source = tmp_path / "source"
+    source.mkdir()
+    (source / "galaxy.yml").write_text("version: 1.0.0\ndependencies:\n  ansible.utils: '*'\n")
+    (root / "ns").mkdir()
+    (root / "ns" / "editable").symlink_to(source)
+
+    meta = collections_meta(local_config)
+
+    assert meta["ansible.utils"]["version"] == "2.0.0"
+    assert meta["ansible.util"]["version"] == "unknown"
+    assert meta["ns.editable"] == {
+        "version": "1.0.0",
+        "editable_location": str(source),
+        "dependencies": {"ansible.utils": "*"},
+    }
+
+
+def test_collections_from_requirements(tmp_path: Path) -> None:
+    """Test string and mapping entries are read from a requirements file.
+
+    Args:
+        tmp_path: A temporary directory
+    """
+    requirements = tmp_path / "requirements.yml"
+    requirements.write_text(
+        "collections:\n  - ansible.utils\n  - name: ansible.posix\n    version: 1.0.0\n  - 1\n",
+    )
+    assert collections_from_requirements(file=requirements) == [
+        {"name": "ansible.utils"},
+        {"name": "ansible.posix", "version": "1.0.0"},
+    ]